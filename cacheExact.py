@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Cache sur disque des solutions exactes pour le projet de COMPLEX 2019-2020.
+
+Les couvertures minimales et les nombres de noeuds calcules par les
+algorithmes de branchement sont gardes dans une base SQLite, avec pour cle
+l'empreinte du graphe (voir empreinte), le nom de la methode, ses arguments
+et la version VERSION des algorithmes. Les appels dont le resultat depend du
+hasard ne sont pas gardes. La base est limitee a tailleMax entrees : au-dela, les entrees
+utilisees il y a le plus longtemps sont supprimees. Plusieurs processus
+peuvent utiliser la meme base (journal WAL, ecritures dans des transactions
+IMMEDIATE, chaque processus ouvre sa propre connexion).
+
+Le cache est actif dans un processus apres activer(nomFichier), ou des
+l'import du module si la variable d'environnement COMPLEX_CACHE_EXACT donne
+le nom de la base (ce qui l'active aussi dans les processus des fonctions
+paralleles de fonctionsTests). Les methodes exactes de Graphe le consultent
+alors d'elles-memes, sauf dans un bloc with sansCache() (utilise par les
+mesures de temps de fonctionsTests).
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    empreinte TEXT NOT NULL,
+    methode TEXT NOT NULL,
+    parametres TEXT NOT NULL,
+    couverture TEXT NOT NULL,
+    taille INTEGER NOT NULL,
+    noeuds INTEGER NOT NULL,
+    acces REAL NOT NULL,
+    PRIMARY KEY (empreinte, methode, parametres)
+);
+CREATE INDEX IF NOT EXISTS solutionsAcces ON solutions (acces);
+"""
+
+#version des algorithmes exacts, a incrementer quand leur resultat 
+#(couverture ou nombre de noeuds) change pour les memes arguments
+VERSION = 2
+
+#arguments des methodes exactes qui ne changent pas le resultat
+_ARGUMENTS_IGNORES = ("debug", "statistiques")
+
+#arguments qui, s'ils sont donnes, gardent un effet de bord de la methode 
+#(attribut statistiquesTable du graphe) : l'appel ne passe pas par le cache
+_ARGUMENTS_EFFETS = ("tailleTable",)
+
+#methodes et couvertures de depart dont le resultat depend du hasard (ou de 
+#l'ordonnancement des processus)
+_METHODES_ALEATOIRES = ("algoBranchementParallele",)
+_COUVERTURES_ALEATOIRES = ("rechercheLocale", "algoRechercheLocale")
+
+#cache actif du processus (voir activer) et profondeur des blocs sansCache
+_actif = None
+_suspendu = 0
+
+def empreinte(graphe):
+    """
+    Retourne l'empreinte d'un graphe : un hachage SHA-256 de la liste des 
+    sommets (noms, dans l'ordre des indices) et des listes d'adjacence (format
+    CSR). Elle depend de l'ordre des sommets et des voisins, comme le nombre 
+    de noeuds parcourus par les algorithmes de branchement : deux 
+    numerotations d'un meme graphe ont des empreintes differentes.
+    Args :
+        graphe : objet du type Graphe.
+    Returns :
+        une chaine de 64 caracteres hexadecimaux.
+    """
+    etiquettes = np.asarray(graphe.etiquettes, dtype = np.int64)
+    h = hashlib.sha256()
+    h.update(np.array([etiquettes.size, graphe.indices.size], dtype = "<i8").tobytes())
+    h.update(etiquettes.astype("<i8").tobytes())
+    h.update(np.asarray(graphe.indptr).astype("<i8").tobytes())
+    h.update(np.asarray(graphe.indices).astype("<i8").tobytes())
+    return h.hexdigest()
+
+class CacheExact:
+    """
+    Classe pour representer un cache de solutions exactes dans une base
+    SQLite.
+
+    Attributs :
+        nomFichier : nom du fichier SQLite.
+        tailleMax : nombre maximum d'entrees de la base.
+        rafraichissement : duree (en secondes) pendant laquelle la date 
+            d'utilisation d'une entree trouvee n'est pas mise a jour, pour ne
+            pas prendre le verrou en ecriture a chaque recherche.
+        trouves, absents : nombres de recherches dans le cache reussies et
+            echouees depuis la creation de l'objet.
+    """
+
+    def __init__(self, nomFichier, tailleMax = 100000, delai = 60, rafraichissement = 600):
+        """
+        Ouvre (et cree si besoin) la base.
+        Args :
+            nomFichier : nom du fichier SQLite.
+            tailleMax (facultatif) : nombre maximum d'entrees.
+            delai (facultatif) : temps maximum d'attente (en secondes) quand
+                la base est verrouillee par un autre processus.
+            rafraichissement (facultatif) : voir les attributs.
+        """
+        self.nomFichier = nomFichier
+        self.tailleMax = tailleMax
+        self.delai = delai
+        self.rafraichissement = rafraichissement
+        self.trouves = 0
+        self.absents = 0
+        self._connexion = None
+        self._pid = None
+
+    def __getstate__(self):
+        #la connexion n'est pas transmise aux autres processus
+        etat = dict(self.__dict__)
+        etat["_connexion"] = None
+        etat["_pid"] = None
+        return etat
+
+    def _connecter(self):
+        """
+        Retourne la connexion du processus courant a la base, ouverte a la
+        premiere utilisation dans chaque processus.
+        """
+        if self._connexion is None or self._pid != os.getpid():
+            connexion = sqlite3.connect(self.nomFichier, timeout = self.delai,
+                                        isolation_level = None)
+            connexion.execute("PRAGMA journal_mode = WAL")
+            connexion.executescript(_SCHEMA)
+            self._connexion = connexion
+            self._pid = os.getpid()
+        return self._connexion
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """
+        Transaction en ecriture : le verrou est pris des le debut, pour ne
+        pas echouer en cas d'ecritures concurrentes.
+        """
+        connexion = self._connecter()
+        connexion.execute("BEGIN IMMEDIATE")
+        try:
+            yield connexion
+        except BaseException:
+            connexion.execute("ROLLBACK")
+            raise
+        connexion.execute("COMMIT")
+
+    def fermer(self):
+        """
+        Ferme la connexion du processus courant.
+        """
+        if self._connexion is not None and self._pid == os.getpid():
+            self._connexion.close()
+        self._connexion = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fermer()
+
+    def __len__(self):
+        return self._connecter().execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def chercher(self, cle):
+        """
+        Cherche une solution dans le cache. Sa date d'utilisation (pour la 
+        suppression des plus anciennes) n'est mise a jour que si elle date de
+        plus de rafraichissement secondes.
+        Args :
+            cle : tuple (empreinte, methode, parametres), voir cle.
+        Returns :
+            un tuple (couverture, noeuds) ou None si la solution n'est pas
+            dans le cache.
+        """
+        connexion = self._connecter()
+        ligne = connexion.execute(
+            "SELECT couverture, noeuds, acces FROM solutions WHERE empreinte = ? "
+            "AND methode = ? AND parametres = ?", cle).fetchone()
+        if ligne is None:
+            self.absents += 1
+            return None
+        self.trouves += 1
+        maintenant = time.time()
+        if maintenant - ligne[2] > self.rafraichissement:
+            with self._transaction() as connexion:
+                connexion.execute(
+                    "UPDATE solutions SET acces = ? WHERE empreinte = ? AND methode = ? "
+                    "AND parametres = ?", (maintenant,) + cle)
+        return set(json.loads(ligne[0])), ligne[1]
+
+    def ajouter(self, cle, couverture, noeuds):
+        """
+        Ajoute une solution au cache, puis supprime les entrees les plus
+        anciennes si le cache depasse tailleMax entrees.
+        Args :
+            cle : tuple (empreinte, methode, parametres), voir cle.
+            couverture : ensemble des sommets (noms) de la couverture.
+            noeuds : nombre de noeuds parcourus.
+        """
+        couverture = sorted(couverture)
+        with self._transaction() as connexion:
+            connexion.execute(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                cle + (json.dumps(couverture), len(couverture), int(noeuds), time.time()))
+            nbEntrees = connexion.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+            if nbEntrees > self.tailleMax:
+                connexion.execute(
+                    "DELETE FROM solutions WHERE rowid IN (SELECT rowid FROM solutions "
+                    "ORDER BY acces LIMIT ?)", (nbEntrees - self.tailleMax,))
+
+    def resoudre(self, graphe, nomMethode, **kwargs):
+        """
+        Retourne le resultat de la methode exacte nomMethode de graphe, pris
+        dans le cache s'il y est, calcule et ajoute au cache sinon.
+        Args :
+            graphe : objet du type Graphe.
+            nomMethode : nom d'une methode de Graphe qui retourne un tuple
+                (couverture, noeuds).
+            **kwargs (facultatif) : arguments passes a la methode.
+        Returns :
+            le tuple (couverture, noeuds).
+        """
+        c = cle(graphe, nomMethode, kwargs)
+        resultat = None if c is None else self.chercher(c)
+        if resultat is None:
+            with sansCache():
+                resultat = getattr(graphe, nomMethode)(**kwargs)
+            if c is not None:
+                self.ajouter(c, *resultat)
+        return resultat
+
+def cle(graphe, nomMethode, kwargs):
+    """
+    Retourne la cle du cache pour un appel de methode, ou None si l'appel ne
+    doit pas passer par le cache (mode debug, statistiques, table de 
+    transposition, resultat qui depend du hasard, ou argument qui ne peut pas etre ecrit en JSON, comme 
+    une couverture de depart donnee par un ensemble).
+    Args :
+        graphe : objet du type Graphe.
+        nomMethode : nom de la methode.
+        kwargs : dictionnaire des arguments de la methode.
+    Returns :
+        un tuple (empreinte, methode, parametres) ou None.
+    """
+    if kwargs.get("debug") or kwargs.get("statistiques") is not None:
+        return None
+    if nomMethode in _METHODES_ALEATOIRES:
+        return None
+    if any(kwargs.get(nom) for nom in _ARGUMENTS_EFFETS):
+        return None
+    couvInitiale = kwargs.get("couvInitiale")
+    if isinstance(couvInitiale, str) and couvInitiale in _COUVERTURES_ALEATOIRES:
+        return None
+    parametres = {k: v for k, v in kwargs.items() if k not in _ARGUMENTS_IGNORES}
+    try:
+        parametres = json.dumps({"version": VERSION, "arguments": parametres}, 
+                                sort_keys = True)
+    except TypeError:
+        return None
+    return empreinte(graphe), nomMethode, parametres
+
+def activer(nomFichier = "cacheExact.sqlite", tailleMax = 100000):
+    """
+    Active le cache pour les methodes exactes de Graphe dans ce processus.
+    Returns :
+        l'objet CacheExact active.
+    """
+    global _actif
+    _actif = CacheExact(nomFichier, tailleMax)
+    return _actif
+
+def desactiver():
+    """
+    Desactive le cache dans ce processus.
+    """
+    global _actif
+    if _actif is not None:
+        _actif.fermer()
+    _actif = None
+
+def cacheActif():
+    """
+    Retourne le cache actif (objet CacheExact), ou None s'il n'y en a pas ou
+    si on est dans un bloc with sansCache().
+    """
+    return None if _suspendu else _actif
+
+@contextlib.contextmanager
+def sansCache():
+    """
+    Bloc dans lequel les methodes exactes de Graphe n'utilisent pas le cache,
+    par exemple pour mesurer leur temps d'execution.
+    """
+    global _suspendu
+    _suspendu += 1
+    try:
+        yield
+    finally:
+        _suspendu -= 1
+
+if os.environ.get("COMPLEX_CACHE_EXACT"):
+    activer(os.environ["COMPLEX_CACHE_EXACT"])
@@ -7,7 +7,9 @@ Fonctions de test pour le projet de COMPLEX 2019-2020
 """
 from projet import Graphe
 from progressBar import ProgressBar
+import cacheExact
 
+import multiprocessing as mp
 import time as t
 import numpy as np
 
@@ -41,9 +43,10 @@ def testTempsN(nMax, p, nomMethode, fois = 10, **kwargs):
         for f in range(fois):
             progressBar.update(ni * fois + f + 1)
             graphe = Graphe(nbSommets = n[ni], probaArete = p)
-            start =  t.process_time()
-            getattr(graphe, nomMethode)(**kwargs)
-            res[ni] += t.process_time() - start
+            with cacheExact.sansCache():
+                start =  t.process_time()
+                getattr(graphe, nomMethode)(**kwargs)
+                res[ni] += t.process_time() - start
     print("")
     
     return res / fois, n
@@ -77,14 +80,15 @@ def testTempsPfunc(nMax, p, nomMethode, fois = 10, **kwargs):
         for f in range(fois):
             progressBar.update(ni * fois + f + 1)
             graphe = Graphe(nbSommets = n[ni], probaArete = p(n[ni]))
-            start =  t.process_time()
-            getattr(graphe, nomMethode)(**kwargs)
-            res[ni] += t.process_time() - start
+            with cacheExact.sansCache():
+                start =  t.process_time()
+                getattr(graphe, nomMethode)(**kwargs)
+                res[ni] += t.process_time() - start
     print("")
     
     return res / fois, n
 
-def testEcart(nMax, p, nomMethode, fois = 10):
+def testEcart(nMax, p, nomMethode, fois = 10, graine = None):
     """
     Teste l'ecart entre les solutions donnees par les algorithmes approches et 
     la solution exacte. L'algorithme approche a etre teste est donne par 
@@ -94,13 +98,18 @@ def testEcart(nMax, p, nomMethode, fois = 10):
     La fonction cree des graphes aleatoires a n sommets pour 10 valeurs de n 
     allant de nMax/10 jusqu'à nMax, avec un choix aleatoire de presence 
     d'aretes donne par la probabilite constante p. Pour chaque n et p, le temps
-    est calcule par une moyenne sur fois graphes.
+    est calcule par une moyenne sur fois graphes. Si le cache du module 
+    cacheExact est actif, les solutions exactes y sont cherchees (ce qui 
+    suppose des graphes donnes par une graine).
     
     Args :
         nMax : valeur maximale du nombre de sommets du graphe.
         p : probabilite de presence d'une arete, constante.
         nomMethode : chaine de caracteres donnant le nom de la methode a tester.
         fois (facultatif) : nombre de repetitions pour chaque valeur de n et p.
+        graine (facultatif) : graine maitre des graphes aleatoires (voir 
+            grainesTaches), qui donne les memes graphes que 
+            testEcartParallele. Si None, les graphes ne sont pas reproductibles.
         
     Returns : 
         res : tableau numpy de taille 10 x fois avec, en ligne i et colonne j, 
@@ -113,11 +122,12 @@ def testEcart(nMax, p, nomMethode, fois = 10):
     n = np.linspace(nMax / 10, nMax, 10, dtype = int)
     res = np.zeros((n.size, fois))
     progressBar = ProgressBar(maxValue = n.size * fois)
+    graines = [None] * (n.size * fois) if graine is None else grainesTaches(graine, n.size * fois)
     
     for ni in range(n.size):
         for f in range(fois):
             progressBar.update(ni * fois + f + 1)
-            graphe = Graphe(nbSommets = n[ni], probaArete = p)
+            graphe = Graphe(nbSommets = n[ni], probaArete = p, graine = graines[ni * fois + f])
             resMethode = getattr(graphe, nomMethode)()
             resExacte, _ = graphe.algoBranchementAmeliore(sommetMax = True, elimDegre1 = True)
             res[ni, f] = len(resMethode) / len(resExacte) if len(resExacte) != 0 else 1
@@ -155,9 +165,206 @@ def testNoeud(n, p, listAlgo):
         for i, (algoName, algoArgs) in enumerate(listAlgo):
             progressBar.update(ni * len(listAlgo) + i + 1)
             graphe = Graphe(nbSommets = n[ni], probaArete = p[ni])
-            _, noeuds = getattr(graphe, algoName)(**algoArgs)
+            with cacheExact.sansCache():
+                _, noeuds = getattr(graphe, algoName)(**algoArgs)
             res[i, ni] = noeuds
     print("")
     
     return res
+
+def testTempsGrandsGraphes(nMax, degreMoyen, nomMethode, nbPoints = 5, graine = 0, 
+                           **kwargs):
+    """
+    Teste le passage a l'echelle d'un algorithme approche sur de grands 
+    graphes creux : la fonction cree des graphes aleatoires a n sommets pour
+    nbPoints valeurs de n allant de nMax/nbPoints jusqu'a nMax, avec 
+    probabilite d'arete degreMoyen / (n - 1) (donc environ 
+    n * degreMoyen / 2 aretes), et mesure le temps processeur de la methode.
+    La pente de la droite de regression de log(temps) en fonction de 
+    log(n + m) vaut 1 pour un algorithme en temps lineaire.
+    
+    Args :
+        nMax : valeur maximale du nombre de sommets du graphe (par exemple 
+            10**6 avec degreMoyen = 20 pour 10^7 aretes).
+        degreMoyen : degre moyen des sommets.
+        nomMethode : chaine de caracteres donnant le nom de la methode a tester
+            (algoCouplage ou algoGloutonNiveaux).
+        nbPoints (facultatif) : nombre de valeurs de n.
+        graine (facultatif) : graine des graphes aleatoires.
+        **kwargs (facultatif) : arguments passes a la methode a tester.
+        
+    Returns : 
+        res : tableau numpy de taille nbPoints avec les temps d'execution en 
+        secondes pour chaque n.
+        n : tableau numpy de taille nbPoints contenant les valeurs de n.
+        m : tableau numpy de taille nbPoints contenant les nombres d'aretes.
+        pente : pente de log(res) en fonction de log(n + m).
+    """
+    n = np.linspace(nMax / nbPoints, nMax, nbPoints, dtype = int)
+    m = np.zeros(n.shape, dtype = int)
+    res = np.zeros(n.shape)
+    graines = grainesTaches(graine, n.size)
+    progressBar = ProgressBar(maxValue = n.size)
+    
+    for ni in range(n.size):
+        progressBar.update(ni + 1)
+        graphe = Graphe(nbSommets = n[ni], probaArete = degreMoyen / (n[ni] - 1), 
+                        graine = graines[ni])
+        m[ni] = graphe.nbAretes
+        with cacheExact.sansCache():
+            start = t.process_time()
+            getattr(graphe, nomMethode)(**kwargs)
+            res[ni] = t.process_time() - start
+        del graphe
+    print("")
+    pente = np.polyfit(np.log(n + m), np.log(res), 1)[0]
+    
+    return res, n, m, pente
+
+#==============================================================================
+# Versions paralleles
+#==============================================================================
+
+def _executerTache(tache):
+    """
+    Execute une tache de executerBenchmark dans un processus de l'ensemble.
+    Returns :
+        un tuple (valeur, tempsProcessus, tempsReel).
+    """
+    n, p, graine, nomMethode, kwargs, mesure = tache
+    graphe = Graphe(nbSommets = n, probaArete = p, graine = graine)
+    with cacheExact.sansCache():
+        startReel = t.perf_counter()
+        start = t.process_time()
+        resMethode = getattr(graphe, nomMethode)(**kwargs)
+        tempsProcessus = t.process_time() - start
+        tempsReel = t.perf_counter() - startReel
+    if mesure == "noeuds":
+        valeur = resMethode[1]
+    elif mesure == "ecart":
+        resExacte, _ = graphe.algoBranchementAmeliore(sommetMax = True, elimDegre1 = True)
+        valeur = len(resMethode) / len(resExacte) if len(resExacte) != 0 else 1
+    else:
+        valeur = 0
+    return valeur, tempsProcessus, tempsReel
+
+def grainesTaches(graine, nbTaches):
+    """
+    Derive de facon deterministe une graine par tache a partir d'une graine 
+    maitre (numpy.random.SeedSequence) : les graphes ne dependent ni du 
+    nombre de processus ni de l'ordre d'execution des taches.
+    Args :
+        graine : graine maitre (entier).
+        nbTaches : nombre de graines a creer.
+    Returns :
+        une liste de nbTaches entiers.
+    """
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(graine).spawn(nbTaches)]
+
+def executerBenchmark(taches, processus = None, base = None):
+    """
+    Execute des taches de test independantes sur un ensemble de processus.
+    Chaque tache cree un graphe aleatoire, lui applique une methode et 
+    mesure le temps processeur (process_time) et le temps reel (perf_counter)
+    de la methode.
+    
+    Args :
+        taches : liste de tuples (n, p, graine, nomMethode, kwargs, mesure), 
+            avec mesure egal a "temps" (valeur 0), "ecart" (rapport avec la 
+            solution exacte, voir testEcart) ou "noeuds" (nombre de noeuds, 
+            voir testNoeud).
+        processus (facultatif) : nombre de processus, par defaut le nombre de
+            coeurs.
+        base (facultatif) : objet resultats.BaseResultats auquel les mesures
+            sont ajoutees.
+        
+    Returns : 
+        valeurs : tableau numpy de taille len(taches) avec la valeur mesuree 
+        par chaque tache.
+        tempsProcessus : tableau numpy de taille len(taches) avec le temps 
+        processeur de la methode, en secondes.
+        tempsReel : tableau numpy de taille len(taches) avec le temps reel de
+        la methode, en secondes.
+    """
+    res = np.zeros((len(taches), 3))
+    progressBar = ProgressBar(maxValue = len(taches))
     
+    with mp.Pool(processus or mp.cpu_count()) as pool:
+        for i, resTache in enumerate(pool.imap(_executerTache, taches)):
+            progressBar.update(i + 1)
+            res[i] = resTache
+    print("")
+    if base is not None:
+        base.ajouterBenchmark(taches, res[:, 0], res[:, 1], res[:, 2])
+    
+    return res[:, 0], res[:, 1], res[:, 2]
+
+def _grilleN(n, p, nomMethode, fois, kwargs, mesure, processus, graine, base = None):
+    """
+    Execute la grille (n, repetition) de testTempsN, testTempsPfunc et 
+    testEcart avec executerBenchmark (mesures ajoutees a base si elle est 
+    donnee). p est une liste de probabilites de meme taille que n.
+    Returns :
+        les trois tableaux de executerBenchmark, de taille n.size x fois.
+    """
+    graines = grainesTaches(graine, n.size * fois)
+    taches = [(int(n[ni]), p[ni], graines[ni * fois + f], nomMethode, kwargs, mesure) 
+              for ni in range(n.size) for f in range(fois)]
+    return [a.reshape(n.size, fois) for a in executerBenchmark(taches, processus, base)]
+
+def testTempsNParallele(nMax, p, nomMethode, fois = 10, processus = None, graine = 0, 
+                        kwargs = None, base = None):
+    """
+    Version parallele de testTempsN : les n.size x fois executions sont 
+    reparties sur processus processus, avec des graphes determines par 
+    graine. Les arguments de la methode sont passes par le dictionnaire 
+    kwargs (aucun si None). Si base (objet resultats.BaseResultats) est 
+    donnee, les mesures y sont ajoutees.
+        
+    Returns : 
+        les memes tableaux que testTempsN (temps processeur moyens et 
+        valeurs de n).
+    """
+    n = np.linspace(nMax / 10, nMax, 10, dtype = int)
+    _, tempsProcessus, _ = _grilleN(n, [p] * n.size, nomMethode, fois, kwargs or {}, 
+                                    "temps", processus, graine, base)
+    return tempsProcessus.mean(axis = 1), n
+
+def testTempsPfuncParallele(nMax, p, nomMethode, fois = 10, processus = None, graine = 0,
+                            kwargs = None, base = None):
+    """
+    Version parallele de testTempsPfunc, voir testTempsNParallele. La 
+    fonction p est evaluee dans le processus principal.
+    """
+    n = np.linspace(nMax / 10, nMax, 10, dtype = int)
+    _, tempsProcessus, _ = _grilleN(n, [p(ni) for ni in n], nomMethode, fois, kwargs or {}, 
+                                    "temps", processus, graine, base)
+    return tempsProcessus.mean(axis = 1), n
+
+def testEcartParallele(nMax, p, nomMethode, fois = 10, processus = None, graine = 0, 
+                       base = None):
+    """
+    Version parallele de testEcart, voir testTempsNParallele.
+    """
+    n = np.linspace(nMax / 10, nMax, 10, dtype = int)
+    res, _, _ = _grilleN(n, [p] * n.size, nomMethode, fois, {}, "ecart", processus, graine, 
+                         base)
+    return res, n
+
+def testNoeudParallele(n, p, listAlgo, processus = None, graine = 0, base = None):
+    """
+    Version parallele de testNoeud, voir testTempsNParallele. Contrairement 
+    a testNoeud, qui tire un nouveau graphe pour chaque algorithme, tous les 
+    algorithmes de listAlgo sont executes, pour chaque valeur de n, sur le 
+    meme graphe aleatoire : les nombres de noeuds d'une colonne sont donc 
+    directement comparables.
+    
+    Returns :
+        res : le meme tableau que testNoeud.
+    """
+    assert n.size == p.size
+    graines = grainesTaches(graine, n.size)
+    taches = [(int(n[ni]), p[ni], graines[ni], algoName, algoArgs, "noeuds") 
+              for algoName, algoArgs in listAlgo for ni in range(n.size)]
+    res, _, _ = executerBenchmark(taches, processus, base)
+    return res.reshape(len(listAlgo), n.size).astype(int)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Resolution par lots pour le projet de COMPLEX 2019-2020.
+
+Un lot de graphes est empile en un seul graphe (union disjointe) : les
+sommets du graphe i ont les indices decalages[i] a decalages[i + 1] - 1 et ses
+aretes sont les lignes debutsAretes[i] a debutsAretes[i + 1] - 1 du tableau
+aretes, dans l'ordre de Graphe.tableauAretes. Les algorithmes approches
+(couplage et glouton) traitent alors tous les graphes du lot a la fois, par
+des operations numpy sur les tableaux empiles ; les algorithmes exacts sont
+repartis sur un seul ensemble de processus pour tout le lot.
+"""
+
+import numpy as np
+
+from projet import couplageAretes, degresAretes
+
+class LotGraphes:
+    """
+    Classe pour representer un lot de graphes empiles.
+
+    Attributs :
+        nbSommets : tableau numpy de taille k avec le nombre de sommets de
+            chaque graphe.
+        decalages : tableau numpy de taille k + 1, indice du premier sommet de
+            chaque graphe dans le graphe empile.
+        aretes : tableau numpy de taille M x 2 avec les aretes de tous les
+            graphes (indices dans le graphe empile).
+        debutsAretes : tableau numpy de taille k + 1, indice de la premiere
+            arete de chaque graphe dans aretes.
+        etiquettes : liste des tableaux de noms des sommets de chaque graphe,
+            ou None si les sommets sont nommes 0 a n - 1.
+        graphes : liste des objets Graphe d'origine (None si le lot a ete cree
+            depuis des tableaux d'aretes).
+    """
+
+    def __init__(self, graphes):
+        """
+        Empile une liste d'objets du type Graphe.
+        """
+        self._empiler([g.nbSommets for g in graphes], [g.tableauAretes() for g in graphes])
+        self.etiquettes = [g.etiquettes for g in graphes]
+        self.graphes = list(graphes)
+
+    @classmethod
+    def depuisAretes(cls, aretes, nbSommets):
+        """
+        Cree un lot depuis des tableaux d'aretes.
+        Args :
+            aretes : liste de tableaux numpy de taille m_i x 2 avec les indices
+                (de 0 a nbSommets[i] - 1) des extremites des aretes du graphe
+                i, dans l'ordre de traitement par le couplage.
+            nbSommets : liste ou tableau avec le nombre de sommets de chaque
+                graphe.
+        Returns :
+            un objet LotGraphes.
+        """
+        lot = cls.__new__(cls)
+        lot._empiler(nbSommets, aretes)
+        lot.etiquettes = None
+        lot.graphes = None
+        return lot
+
+    def _empiler(self, nbSommets, aretes):
+        """
+        Construit les tableaux empiles et les listes d'adjacence (CSR) du
+        graphe empile.
+        """
+        self.nbSommets = np.asarray(nbSommets, dtype = np.int64).reshape(-1)
+        self.decalages = np.zeros(self.nbSommets.size + 1, dtype = np.int64)
+        np.cumsum(self.nbSommets, out = self.decalages[1:])
+        tailles = np.array([len(a) for a in aretes], dtype = np.int64)
+        self.debutsAretes = np.zeros(tailles.size + 1, dtype = np.int64)
+        np.cumsum(tailles, out = self.debutsAretes[1:])
+        if tailles.sum() > 0:
+            locales = np.concatenate([np.asarray(a, dtype = np.int64).reshape(-1, 2)
+                                      for a in aretes])
+        else:
+            locales = np.zeros((0, 2), dtype = np.int64)
+        self.aretes = locales + np.repeat(self.decalages[:-1], tailles)[:, None]
+        #listes d'adjacence du graphe empile
+        n = int(self.decalages[-1])
+        extremites = np.concatenate((self.aretes[:, 0], self.aretes[:, 1]))
+        autres = np.concatenate((self.aretes[:, 1], self.aretes[:, 0]))
+        ordre = np.argsort(extremites, kind = "stable")
+        self.degres = degresAretes(self.aretes, n)
+        self.indptr = np.zeros(n + 1, dtype = np.int64)
+        np.cumsum(self.degres, out = self.indptr[1:])
+        self.indices = autres[ordre]
+
+    def __len__(self):
+        return self.nbSommets.size
+
+    def grapheDeSommet(self):
+        """
+        Retourne un tableau numpy de taille N donnant, pour chaque sommet du
+        graphe empile, l'indice de son graphe dans le lot.
+        """
+        return np.repeat(np.arange(len(self)), self.nbSommets)
+
+    def _couvertures(self, choisis):
+        """
+        Separe par graphe un tableau de sommets du graphe empile.
+        Returns :
+            la liste des couvertures (ensembles de noms des sommets) et le
+            tableau numpy de leurs tailles.
+        """
+        choisis = np.sort(choisis)
+        tailles = np.bincount(self.grapheDeSommet()[choisis], minlength = len(self))
+        bornes = np.zeros(len(self) + 1, dtype = np.int64)
+        np.cumsum(tailles, out = bornes[1:])
+        couvertures = []
+        for i in range(len(self)):
+            locaux = choisis[bornes[i]:bornes[i + 1]] - self.decalages[i]
+            if self.etiquettes is None:
+                couvertures.append(set(locaux.tolist()))
+            else:
+                couvertures.append(set(self.etiquettes[i][locaux].tolist()))
+        return couvertures, tailles
+
+def _lot(graphes):
+    """
+    Retourne graphes sous la forme d'un objet LotGraphes.
+    """
+    return graphes if isinstance(graphes, LotGraphes) else LotGraphes(graphes)
+
+def couplageLot(graphes):
+    """
+    Applique Graphe.algoCouplage a tous les graphes d'un lot : le couplage
+    glouton (aretes prises dans l'ordre) est calcule sur les aretes du graphe
+    empile par projet.couplageAretes. Les graphes du lot etant disjoints, les
+    couvertures sont identiques a celles de algoCouplage.
+    Args :
+        graphes : liste d'objets du type Graphe ou objet LotGraphes.
+    Returns :
+        un tuple forme par la liste des couvertures (ensembles de sommets) et
+        le tableau numpy de leurs tailles.
+    """
+    lot = _lot(graphes)
+    couvert = couplageAretes(lot.aretes, int(lot.decalages[-1]))
+    return lot._couvertures(np.flatnonzero(couvert))
+
+def gloutonLot(graphes):
+    """
+    Applique Graphe.algoGloutonSansCopies (et donc Graphe.algoGlouton) a
+    tous les graphes d'un lot : a chaque tour, on retire dans chaque graphe
+    qui a encore des aretes le premier sommet de degre maximum. Le nombre de
+    tours est la taille de la plus grande couverture du lot.
+    Args :
+        graphes : liste d'objets du type Graphe ou objet LotGraphes.
+    Returns :
+        un tuple forme par la liste des couvertures (ensembles de sommets) et
+        le tableau numpy de leurs tailles.
+    """
+    lot = _lot(graphes)
+    degres = lot.degres.copy()
+    vivants = np.ones(degres.size, dtype = bool)
+    #les graphes sans sommets ne forment pas de segment pour reduceat
+    debuts = lot.decalages[np.flatnonzero(lot.nbSommets > 0)]
+    #cle croissante avec le degre puis decroissante avec l'indice local,
+    #pour prendre le premier sommet de degre maximum de chaque graphe
+    base = int(lot.nbSommets.max(initial = 0)) + 1
+    locaux = np.arange(degres.size) - np.repeat(lot.decalages[:-1], lot.nbSommets)
+    rang = base - 1 - locaux
+    choisis = []
+    while debuts.size:
+        cles = np.maximum.reduceat(degres * base + rang, debuts)
+        #seuls les graphes qui ont encore des aretes choisissent un sommet
+        actifs = cles >= base
+        if not actifs.any():
+            break
+        v = debuts[actifs] + (base - 1 - cles[actifs] % base)
+        choisis.append(v)
+        #voisins des sommets choisis (au plus un sommet par graphe, donc
+        #sans repetition)
+        longueurs = lot.indptr[v + 1] - lot.indptr[v]
+        positions = (np.repeat(lot.indptr[v] - np.cumsum(longueurs) + longueurs, longueurs)
+                     + np.arange(longueurs.sum()))
+        voisins = lot.indices[positions]
+        degres[voisins[vivants[voisins]]] -= 1
+        degres[v] = 0
+        vivants[v] = False
+    choisis = np.concatenate(choisis) if choisis else np.zeros(0, dtype = np.int64)
+    return lot._couvertures(choisis)
+
+#algorithmes approches traites par des operations vectorisees sur le lot
+_METHODES_LOT = {"algoCouplage": couplageLot, "algoGlouton": gloutonLot,
+                 "algoGloutonSansCopies": gloutonLot}
+
+def resoudreLot(graphes, nomMethode, processus = None, **kwargs):
+    """
+    Applique une methode de Graphe a tous les graphes d'un lot. Les
+    algorithmes approches algoCouplage, algoGlouton et algoGloutonSansCopies
+    sont vectorises sur le lot (voir couplageLot et gloutonLot) ; les autres
+    methodes sont reparties sur un seul ensemble de processus (voir
+    parallele.resoudreGraphes).
+    Args :
+        graphes : liste d'objets du type Graphe ou objet LotGraphes.
+        nomMethode : nom de la methode de Graphe a appliquer.
+        processus (facultatif) : nombre de processus pour les methodes non
+            vectorisees, par defaut le nombre de coeurs.
+        **kwargs (facultatif) : arguments passes a la methode.
+    Returns :
+        un tuple (couvertures, tailles, noeuds) : la liste des couvertures, le
+        tableau numpy de leurs tailles et, pour les methodes qui le
+        retournent, le tableau numpy des nombres de noeuds (None sinon).
+    """
+    if nomMethode in _METHODES_LOT and not kwargs:
+        couvertures, tailles = _METHODES_LOT[nomMethode](graphes)
+        return couvertures, tailles, None
+    import parallele
+    if isinstance(graphes, LotGraphes):
+        if graphes.graphes is None:
+            raise ValueError("le lot doit etre cree depuis des objets Graphe")
+        graphes = graphes.graphes
+    resultats = parallele.resoudreGraphes(graphes, nomMethode, kwargs, processus)
+    if resultats and isinstance(resultats[0], tuple):
+        couvertures = [r[0] for r in resultats]
+        noeuds = np.array([r[1] for r in resultats], dtype = np.int64)
+    else:
+        couvertures, noeuds = resultats, None
+    return couvertures, np.array([len(c) for c in couvertures], dtype = np.int64), noeuds
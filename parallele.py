@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Recherche exacte en parallele pour le projet de COMPLEX 2019-2020.
+
+Le haut de l'arbre de branchement est parcouru dans le processus principal,
+puis les noeuds restant dans la pile (la frontiere) sont distribues a un
+ensemble de processus. Chaque tache est limitee en nombre de noeuds : un
+processus qui n'a pas fini renvoie sa pile, qui est redecoupee en deux
+nouvelles taches. La meilleure borne maximale est partagee par tous les
+processus, qui elaguent donc tous par rapport a la meilleure solution connue.
+"""
+
+import multiprocessing as mp
+import queue
+
+from projet import Branchement
+
+#variables globales de chaque processus, initialisees par _initialiser
+_graphe = None
+_options = None
+_partage = None
+
+def _initialiser(graphe, options, partage):
+    """
+    Initialise un processus de l'ensemble : le graphe et la borne partagee
+    ne sont transmis qu'une fois par processus.
+    """
+    global _graphe, _options, _partage
+    _graphe = graphe
+    _options = options
+    _partage = partage
+
+def _executerTache(pile, noeudsMax):
+    """
+    Parcourt les noeuds de pile (sous forme absolue, voir
+    Branchement.pileAbsolue) en visitant au plus noeudsMax noeuds.
+    Returns :
+        un tuple (couverture, noeuds, reste) avec la liste des indices de la
+        meilleure couverture trouvee (None si aucune feuille n'a ete
+        atteinte), le nombre de noeuds visites et la pile restante sous forme
+        absolue.
+    """
+    recherche = Branchement(_graphe, pile = list(pile), partage = _partage, **_options)
+    recherche.borneMax = _partage.value
+    recherche.couvMin = None
+    fini = recherche.executer(noeudsMax)
+    reste = [] if fini else recherche.pileAbsolue()
+    return recherche.couvMin, recherche.cpt, reste
+
+def branchementParallele(graphe, options, processus = None, noeudsParTache = 2000,
+                         tachesParProcessus = 4, couvInitiale = None):
+    """
+    Determine une solution exacte au probleme de la couverture minimale en
+    repartissant l'arbre de branchement sur plusieurs processus.
+    Args :
+        graphe : objet du type Graphe.
+        options : dictionnaire d'arguments de Branchement (brancherSommet,
+            elagage, methodeMax, methodeMin, sommetMax, elimDegre1).
+        processus (facultatif) : nombre de processus, par defaut le nombre
+            de coeurs.
+        noeudsParTache (facultatif) : nombre maximum de noeuds visites par
+            une tache avant de rendre sa pile pour qu'elle soit redecoupee.
+        tachesParProcessus (facultatif) : nombre de taches par processus a
+            creer dans le processus principal avant la distribution.
+        couvInitiale (facultatif) : liste des indices d'une couverture de
+            depart.
+    Returns :
+        Un tuple forme par un ensemble de sommets qui forment une couverture
+        minimale du graphe et le nombre total des noeuds de l'arbre parcourus
+        par tous les processus.
+    """
+    processus = processus or mp.cpu_count()
+    #parcours du haut de l'arbre jusqu'a avoir une frontiere assez grande
+    racine = Branchement(graphe, couvInitiale = couvInitiale, **options)
+    while len(racine.pile) < tachesParProcessus * processus:
+        if racine.executer(1):
+            return racine.resultat()
+    couvMin = racine.couvMin
+    cpt = racine.cpt
+    partage = mp.Value("q", min(racine.borneMax, len(couvMin)))
+    #chaque noeud de la frontiere devient une tache
+    taches = [[noeud] for noeud in racine.pileAbsolue()]
+
+    with mp.Pool(processus, initializer = _initialiser,
+                 initargs = (graphe, options, partage)) as pool:
+        resultats = queue.Queue()
+        enCours = 0
+        while taches or enCours:
+            #on lance les taches en attente, les dernieres empilees d'abord
+            while taches:
+                pool.apply_async(_executerTache, (taches.pop(), noeudsParTache),
+                                 callback = resultats.put, error_callback = resultats.put)
+                enCours += 1
+            resultat = resultats.get()
+            enCours -= 1
+            if isinstance(resultat, BaseException):
+                raise resultat
+            couverture, noeuds, reste = resultat
+            cpt += noeuds
+            if couverture is not None and len(couverture) < len(couvMin):
+                couvMin = couverture
+            #on redecoupe la pile restante en deux taches : le bas de la pile
+            #(les plus gros sous-arbres) et le haut
+            if len(reste) > 1:
+                taches.append(reste[:len(reste) // 2])
+                taches.append(reste[len(reste) // 2:])
+            elif reste:
+                taches.append(reste)
+    return graphe._noms(couvMin), cpt
+
+def _resoudreGraphe(tache):
+    """
+    Applique une methode de Graphe a un graphe, pour resoudreGraphes.
+    """
+    graphe, nomMethode, kwargs = tache
+    return getattr(graphe, nomMethode)(**kwargs)
+
+def resoudreGraphes(graphes, nomMethode, kwargs = None, processus = None):
+    """
+    Applique une meme methode de Graphe a plusieurs graphes independants (par
+    exemple les composantes connexes d'un graphe) en parallele.
+    Args :
+        graphes : liste d'objets du type Graphe.
+        nomMethode : nom de la methode de Graphe a appliquer.
+        kwargs (facultatif) : dictionnaire des arguments passes a la methode
+            (aucun si None).
+        processus (facultatif) : nombre de processus, par defaut le nombre
+            de coeurs.
+    Returns :
+        la liste des resultats, dans l'ordre des graphes.
+    """
+    with mp.Pool(processus or mp.cpu_count()) as pool:
+        return pool.map(_resoudreGraphe, [(g, nomMethode, kwargs or {}) for g in graphes],
+                        chunksize = 1)
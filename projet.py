@@ -7,18 +7,82 @@ Created on Thu Oct 10 16:33:23 2019
 Méthodes pour le projet de COMPLEX 2019-2020
 """
 
+import functools
+import heapq
+import inspect
+import math
+import os
+import struct
+import time
+from collections import OrderedDict, namedtuple
+
 import networkx as nx
 import numpy as np
 
+import cacheExact
+
+#heuristiques pour la couverture de depart des recherches exactes
+_HEURISTIQUES = {"couplage": "algoCouplage", "glouton": "algoGloutonSeaux",
+                 "rechercheLocale": "algoRechercheLocale"}
+
+#nombre d'aretes a partir duquel algoGloutonSeaux passe par gloutonNiveaux
+_SEUIL_GLOUTON_NIVEAUX = 100000
+
+#resultat de Graphe.algoBranchementAnytime
+ResultatAnytime = namedtuple("ResultatAnytime", 
+                             ["couverture", "noeuds", "borneInf", "ecart", "optimal"])
+
+def _avecCache(methode):
+    """
+    Decorateur des methodes exactes de Graphe : si un cache est actif (voir 
+    le module cacheExact), le resultat est pris dans le cache s'il y est, et
+    y est ajoute sinon. Les appels avec une table de transposition ne passent
+    pas par le cache (voir cacheExact.cle) ; pour les autres, l'attribut 
+    statistiquesTable est remis a None comme le ferait la methode.
+    """
+    signature = inspect.signature(methode)
+    
+    @functools.wraps(methode)
+    def methodeAvecCache(self, *args, **kwargs):
+        cache = cacheExact.cacheActif()
+        if cache is None:
+            return methode(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        del arguments["self"]
+        if "tailleTable" in arguments:
+            self.statistiquesTable = None
+        return cache.resoudre(self, methode.__name__, **arguments)
+    return methodeAvecCache
+
 class Graphe:
     """
     Classe pour representer des graphes non orientés.
     Contient des fonctions de creation, manipulation et des algorithmes pour
     le calcul exact et approché d'une couverture minimale.
-    Utilise le module networkx pour manipuler des graphes.
+    Les sommets sont renumerotes de 0 a n - 1 (dans l'ordre d'insertion) et 
+    les listes d'adjacence sont stockees au format CSR dans des tableaux 
+    numpy. Le module networkx n'est utilise que pour l'import et l'export.
     
     Attributs :
-        graphe : objet du type networkx.Graph. 
+        etiquettes : tableau numpy de taille n contenant, en position i, le 
+            nom d'origine du sommet d'indice i.
+        indptr : tableau numpy de taille n + 1. Les voisins du sommet d'indice
+            i sont indices[indptr[i]:indptr[i + 1]].
+        indices : tableau numpy de taille 2m contenant les listes d'adjacence
+            concatenees, dans l'ordre d'insertion des aretes.
+        degres : tableau numpy de taille n contenant les degres des sommets.
+    
+    Memoire (grands graphes) : indices occupe 8 octets par arete (entiers de
+    32 bits tant que n < 2^31), indptr, degres et etiquettes 24 octets par 
+    sommet. Le tableau des aretes (tableauAretes), calcule a la premiere 
+    utilisation par algoCouplage, rajoute 16 octets par arete. Le pic pendant 
+    la construction d'un graphe aleatoire est d'environ 110 octets par arete
+    (environ 1,1 Go pour 10^6 sommets et 10^7 aretes). Pour ces graphes, on
+    utilise algoCouplage et algoGloutonNiveaux, en temps lineaire, et on 
+    importe ou exporte avec depuisAretes, depuisMatriceCreuse et 
+    versMatriceCreuse plutot qu'avec networkx.
     """
     
     def __init__(self, **kwargs):
@@ -29,65 +93,408 @@ class Graphe:
         Args : 
             nomFichier (facultatif) : nom d'un fichier depuis lequel on lit le 
                 graphe. Le format attendu est celui donné à l'enoncé.
+            nomBinaire (facultatif) : nom d'un fichier au format binaire (voir
+                sauvegarderBinaire), ouvert par projection en memoire.
             nbSommets (facultatif) : nombre de sommets du graphe aleatoire a 
                 etre cree.
             probaArete (facultatif) : probabilite d'avoir une arete (i, j) au 
                 graphe aleatoire, i et j deux sommets quelconques. Les tirages
                 sont independants.
+            graine (facultatif) : graine (entier) ou objet 
+                numpy.random.Generator utilise pour le graphe aleatoire. Une 
+                meme graine donne toujours le meme graphe.
         """
-        self.graphe = nx.Graph()
+        self._construire(np.zeros(0, dtype = np.int64), 
+                         np.zeros(0, dtype = np.int64), 
+                         np.zeros(0, dtype = np.int64))
         if "nomFichier" in kwargs:
             self._readFile(kwargs["nomFichier"])
+        elif "nomBinaire" in kwargs:
+            self._chargerBinaire(kwargs["nomBinaire"])
         elif "nbSommets" in kwargs and "probaArete" in kwargs:
-            self._creerAlea(kwargs["nbSommets"], kwargs["probaArete"])
+            self._creerAlea(kwargs["nbSommets"], kwargs["probaArete"], 
+                            kwargs.get("graine"))
+
+#==============================================================================
+# Representation CSR et conversions
+#==============================================================================
+
+    def _construire(self, etiquettes, debuts, fins, dedoublonner = True):
+        """
+        Modifie les attributs du graphe a partir d'une liste de sommets et 
+        d'une liste d'aretes donnee par les indices de leurs extremites. 
+        L'ordre des sommets et l'ordre d'insertion des aretes sont conserves, 
+        de sorte que les parcours de sommets et d'aretes se font dans le meme 
+        ordre que pour un networkx.Graph construit avec les memes appels.
+        Args :
+            etiquettes : tableau numpy des noms des sommets, sans doublons.
+            debuts, fins : tableaux numpy de meme taille contenant les indices
+                (entre 0 et n - 1) des extremites de chaque arete.
+            dedoublonner (facultatif) : si False, on suppose que la liste 
+                d'aretes ne contient pas de doublons.
+        """
+        n = etiquettes.size
+        debuts = np.asarray(debuts, dtype = np.int64)
+        fins = np.asarray(fins, dtype = np.int64)
+        if np.any(debuts == fins):
+            raise ValueError("les boucles (aretes (i, i)) ne sont pas supportees")
+        if dedoublonner and debuts.size > 0:
+            #on garde la premiere occurrence de chaque arete
+            cles = np.minimum(debuts, fins) * n + np.maximum(debuts, fins)
+            _, premieres = np.unique(cles, return_index = True)
+            premieres.sort()
+            debuts = debuts[premieres]
+            fins = fins[premieres]
+        #chaque arete apparait dans les deux sens, dans l'ordre d'insertion
+        sources = np.column_stack((debuts, fins)).ravel()
+        cibles = np.column_stack((fins, debuts)).ravel()
+        ordre = np.argsort(sources, kind = "stable")
+        
+        self.etiquettes = etiquettes
+        self.degres = np.bincount(sources, minlength = n)
+        self.indptr = np.zeros(n + 1, dtype = np.int64)
+        np.cumsum(self.degres, out = self.indptr[1:])
+        self.indices = cibles[ordre].astype(np.int32 if n < 2**31 else np.int64)
+        self._indiceDe = None
+        self._aretes = None
+        self._grapheNx = None
+        
+    @property
+    def nbSommets(self):
+        """
+        Nombre de sommets du graphe.
+        """
+        return self.etiquettes.size
+    
+    @property
+    def nbAretes(self):
+        """
+        Nombre d'aretes du graphe.
+        """
+        return self.indices.size // 2
+    
+    def _indice(self, sommet):
+        """
+        Retourne l'indice interne (entre 0 et n - 1) d'un sommet.
+        Args :
+            sommet : nom du sommet.
+        Returns :
+            l'indice du sommet dans les tableaux CSR.
+        """
+        if self._indiceDe is None:
+            self._indiceDe = {s: i for i, s in enumerate(self.etiquettes.tolist())}
+        return self._indiceDe[sommet]
+    
+    def _noms(self, indices):
+        """
+        Retourne l'ensemble des noms des sommets dont les indices sont donnes.
+        """
+        return set(self.etiquettes[np.asarray(list(indices), dtype = np.int64)].tolist())
+    
+    def sommets(self):
+        """
+        Retourne la liste des sommets du graphe, dans l'ordre d'insertion.
+        """
+        return self.etiquettes.tolist()
+    
+    def tableauAretes(self):
+        """
+        Retourne les aretes du graphe sous la forme d'un tableau numpy de 
+        taille m x 2 contenant les indices des extremites. Les aretes sont 
+        donnees dans le meme ordre que networkx.Graph.edges.
+        """
+        if self._aretes is None:
+            lignes = np.repeat(np.arange(self.nbSommets), self.degres)
+            garder = self.indices > lignes
+            self._aretes = np.column_stack((lignes[garder], self.indices[garder]))
+        return self._aretes
+    
+    def listeAretes(self):
+        """
+        Retourne la liste des aretes du graphe (avec les noms des sommets), 
+        dans le meme ordre que networkx.Graph.edges.
+        """
+        return [tuple(a) for a in self.etiquettes[self.tableauAretes()].tolist()]
+    
+    @classmethod
+    def depuisAretes(cls, aretes, nbSommets = None, dedoublonner = True):
+        """
+        Cree un graphe de sommets 0 a nbSommets - 1 a partir d'un tableau 
+        d'aretes, sans passer par networkx.
+        Args :
+            aretes : tableau numpy d'entiers de taille m x 2.
+            nbSommets (facultatif) : nombre de sommets, par defaut le plus 
+                grand sommet des aretes plus 1.
+            dedoublonner (facultatif) : si False, on suppose que aretes ne 
+                contient pas de doublons.
+        Returns :
+            un nouvel objet Graphe.
+        """
+        aretes = np.asarray(aretes, dtype = np.int64).reshape(-1, 2)
+        if nbSommets is None:
+            nbSommets = int(aretes.max(initial = -1)) + 1
+        g = cls()
+        g._construire(np.arange(nbSommets, dtype = np.int64), aretes[:, 0], aretes[:, 1], 
+                      dedoublonner)
+        return g
+    
+    @classmethod
+    def depuisMatriceCreuse(cls, matrice):
+        """
+        Cree un graphe a partir d'une matrice d'adjacence creuse de scipy 
+        (ou de tout objet accepte par scipy.sparse.coo_matrix) : les sommets
+        sont les indices 0 a n - 1 et (i, j) est une arete si le coefficient
+        (i, j) ou (j, i) est non nul. La diagonale est ignoree.
+        Args :
+            matrice : matrice carree n x n.
+        Returns :
+            un nouvel objet Graphe.
+        """
+        import scipy.sparse
+        
+        coo = scipy.sparse.coo_matrix(matrice)
+        if coo.shape[0] != coo.shape[1]:
+            raise ValueError("la matrice d'adjacence doit etre carree")
+        garder = (coo.row != coo.col) & (coo.data != 0)
+        g = cls()
+        g._construire(np.arange(coo.shape[0], dtype = np.int64), coo.row[garder], 
+                      coo.col[garder])
+        return g
+    
+    def versMatriceCreuse(self):
+        """
+        Exporte le graphe vers sa matrice d'adjacence creuse (scipy), les 
+        lignes et colonnes etant les indices internes des sommets.
+        Returns :
+            un objet scipy.sparse.csr_matrix de taille n x n.
+        """
+        import scipy.sparse
+        
+        return scipy.sparse.csr_matrix((np.ones(self.indices.size, dtype = np.int8), 
+                                        self.indices, self.indptr), 
+                                       shape = (self.nbSommets, self.nbSommets))
+    
+    @classmethod
+    def depuisNetworkx(cls, grapheNx):
+        """
+        Cree un graphe a partir d'un objet du type networkx.Graph.
+        Args :
+            grapheNx : graphe networkx a etre importe.
+        Returns :
+            un nouvel objet Graphe.
+        """
+        g = cls()
+        g._importerNetworkx(grapheNx)
+        return g
+    
+    def _importerNetworkx(self, grapheNx):
+        """
+        Modifie les attributs du graphe pour qu'il soit une copie du graphe 
+        networkx grapheNx.
+        """
+        etiquettes = np.array(list(grapheNx.nodes), dtype = np.int64)
+        self._construire(etiquettes, [], [])
+        #on reproduit l'ordre des listes d'adjacence de grapheNx
+        adj = [(self._indice(u), self._indice(v)) for u in grapheNx.nodes for v in grapheNx.adj[u]]
+        adj = np.array(adj, dtype = np.int64).reshape(-1, 2)
+        if np.any(adj[:, 0] == adj[:, 1]):
+            raise ValueError("les boucles (aretes (i, i)) ne sont pas supportees")
+        self.degres = np.bincount(adj[:, 0], minlength = etiquettes.size)
+        np.cumsum(self.degres, out = self.indptr[1:])
+        self.indices = adj[:, 1].astype(self.indices.dtype)
+    
+    def versNetworkx(self):
+        """
+        Exporte le graphe vers un objet du type networkx.Graph, avec les noms
+        d'origine des sommets et le meme ordre de sommets et d'aretes.
+        Returns :
+            un nouveau networkx.Graph.
+        """
+        grapheNx = nx.Graph()
+        grapheNx.add_nodes_from(self.sommets())
+        grapheNx.add_edges_from(self.listeAretes())
+        return grapheNx
+    
+    @property
+    def graphe(self):
+        """
+        Vue en lecture seule (networkx.freeze) du graphe au format 
+        networkx.Graph, gardee pour compatibilite. Elle est construite a la 
+        premiere lecture puis reutilisee. Les modifications (add_edge, 
+        remove_node, ...) levent networkx.NetworkXError : seule l'affectation 
+        d'un networkx.Graph a cet attribut remplace le graphe (pour modifier 
+        une copie, utiliser versNetworkx).
+        """
+        if self._grapheNx is None:
+            self._grapheNx = nx.freeze(self.versNetworkx())
+        return self._grapheNx
+    
+    @graphe.setter
+    def graphe(self, grapheNx):
+        self._importerNetworkx(grapheNx)
 
 #==============================================================================
 # Fonctions de creation et manipulation
 #==============================================================================
     
-    def _readFile(self, nomFichier):
+    def _readFile(self, nomFichier, tailleBloc = None):
         """
-        Modifie l'attribut graphe, en lisant des donnees a partir d'un fichier.
+        Modifie les attributs du graphe, en lisant des donnees a partir d'un 
+        fichier. Les sections des sommets et des aretes sont converties en 
+        tableaux numpy en bloc (voir LecteurInstance).
         Args : 
             nomFichier : nom d'un fichier depuis lequel on lit le graphe. Le 
                 format attendu est celui donné à l'enoncé.
+            tailleBloc (facultatif) : nombre d'octets lus a chaque etape. Si 
+                None, le fichier est lu en une seule fois.
+        Raises :
+            ValueError si le fichier ne respecte pas le format.
         """
-        with open(nomFichier, 'r') as file:
-            assert file.readline() == "Nombre de sommets\n"
-            nbSommets = int(file.readline())
-            assert file.readline() == "Sommets\n"
-            
-            for i in range(nbSommets):
-                nomSommet = int(file.readline())
-                self.graphe.add_node(nomSommet)
- 
-            assert file.readline() == "Nombre d aretes\n"
-            nbAretes = int(file.readline())
-            assert file.readline() == "Aretes\n"
-            
-            for i in range(nbAretes):
-                line = file.readline()
-                debut, fin = line.split(" ")
-                debut = int(debut)
-                fin = int(fin)
-                self.graphe.add_edge(debut, fin)
+        with LecteurInstance(nomFichier, tailleBloc) as lecteur:
+            sommets = list(lecteur.blocsSommets())
+            aretes = list(lecteur.blocsAretes())
+        sommets = np.concatenate(sommets) if sommets else np.zeros(0, dtype = np.int64)
+        aretes = np.concatenate(aretes) if aretes else np.zeros((0, 2), dtype = np.int64)
+        self._depuisNoms(sommets, aretes)
+    
+    def sauvegarderBinaire(self, nomFichier):
+        """
+        Enregistre le graphe dans un fichier binaire. Le fichier contient une 
+        entete de 64 octets (identifiant, version, taille en octets des 
+        indices, n, m) suivie des tableaux etiquettes (int64), indptr (int64),
+        degres, indices et aretes (tableau m x 2), chacun aligne sur 64 
+        octets. Les trois derniers sont en int32 si n < 2^31.
+        Args :
+            nomFichier : nom du fichier a ecrire.
+        """
+        largeur = self.indices.dtype.itemsize
+        with open(nomFichier, "wb") as file:
+            file.write(struct.pack(_FORMAT_ENTETE, _IDENTIFIANT_BINAIRE, _VERSION_BINAIRE, 
+                                   largeur, self.nbSommets, self.nbAretes).ljust(64, b"\0"))
+            for tableau, _, _ in _sectionsBinaires(self.nbSommets, self.nbAretes, largeur):
+                donnees = getattr(self, tableau) if tableau != "aretes" else self.tableauAretes()
+                dtype = np.int64 if tableau in ("etiquettes", "indptr") else self.indices.dtype
+                octets = np.ascontiguousarray(donnees, dtype = dtype).tobytes()
+                file.write(octets.ljust(-(-len(octets) // 64) * 64, b"\0"))
+    
+    def _chargerBinaire(self, nomFichier):
+        """
+        Modifie les attributs du graphe pour qu'ils soient des projections en 
+        memoire (numpy.memmap en lecture seule) des tableaux d'un fichier ecrit
+        par sauvegarderBinaire. L'ouverture ne lit que l'entete, et plusieurs 
+        processus qui ouvrent le meme fichier partagent les memes pages.
+        Args :
+            nomFichier : nom du fichier binaire.
+        Raises :
+            ValueError si le fichier n'est pas au bon format.
+        """
+        with open(nomFichier, "rb") as file:
+            entete = file.read(64)
+        if len(entete) < 64 or entete[:8] != _IDENTIFIANT_BINAIRE:
+            raise ValueError("{} : fichier binaire de graphe invalide".format(nomFichier))
+        _, version, largeur, n, m = struct.unpack_from(_FORMAT_ENTETE, entete)
+        if version != _VERSION_BINAIRE or largeur not in (4, 8):
+            raise ValueError("{} : version {} ou largeur d'indices {} non supportee"
+                             .format(nomFichier, version, largeur))
+        for tableau, debut, forme in _sectionsBinaires(n, m, largeur):
+            dtype = np.int64 if tableau in ("etiquettes", "indptr") else np.dtype("<i{}".format(largeur))
+            if np.prod(forme) == 0:
+                valeur = np.zeros(forme, dtype = dtype)
+            else:
+                valeur = np.memmap(nomFichier, dtype = dtype, mode = "r", offset = debut, shape = forme)
+            setattr(self, "_aretes" if tableau == "aretes" else tableau, valeur)
+        self._indiceDe = None
+        self._grapheNx = None
+    
+    def _depuisNoms(self, sommets, aretes):
+        """
+        Modifie les attributs du graphe a partir d'une liste de noms de sommets
+        et d'une liste d'aretes entre noms de sommets. Comme avec networkx, 
+        les sommets qui n'apparaissent que dans les aretes sont rajoutes a la
+        fin, dans l'ordre de leur premiere apparition.
+        Args :
+            sommets : tableau ou liste des noms des sommets.
+            aretes : tableau m x 2 ou liste de couples de noms de sommets.
+        """
+        sommets = np.asarray(sommets, dtype = np.int64).ravel()
+        aretes = np.asarray(aretes, dtype = np.int64).reshape(-1, 2)
+        #cas frequent ou les sommets sont deja 0, 1, ..., n - 1
+        if (np.array_equal(sommets, np.arange(sommets.size)) 
+            and (aretes.size == 0 or (aretes.min() >= 0 and aretes.max() < sommets.size))):
+            self._construire(sommets, aretes[:, 0], aretes[:, 1])
+            return
+        tous = np.concatenate((sommets, aretes.ravel()))
+        _, premieres, inverse = np.unique(tous, return_index = True, return_inverse = True)
+        #renumerotation dans l'ordre de premiere apparition
+        ordre = np.argsort(premieres, kind = "stable")
+        rang = np.empty_like(ordre)
+        rang[ordre] = np.arange(ordre.size)
+        etiquettes = tous[premieres[ordre]]
+        extremites = rang[inverse[sommets.size:]].reshape(-1, 2)
+        self._construire(etiquettes, extremites[:, 0], extremites[:, 1])
                 
-    def _creerAlea(self, nbSommets, probaArete):
+    def _creerAlea(self, nbSommets, probaArete, graine = None):
         """
-        Modifie l'attribut graphe, en creant nbSommets sommets et en rajoutant
-        des aretes de façon aleatoire.
+        Modifie les attributs du graphe, en creant nbSommets sommets et en 
+        rajoutant des aretes de façon aleatoire.
+        Les n(n - 1)/2 paires (i, j), i < j, sont numerotees dans l'ordre 
+        lexicographique et les paires retenues sont tirees par blocs : par 
+        sauts geometriques (en O(n + m)) si probaArete est petite, par un 
+        masque sur des blocs de paires sinon.
         Args :
             nbSommets : nombre de sommets du graphe aleatoire a etre cree.
             probaArete : probabilite d'avoir une arete (i, j) au graphe 
                 aleatoire, i et j deux sommets quelconques. Les tirages sont 
                 independants.
+            graine (facultatif) : graine (entier) ou objet 
+                numpy.random.Generator. Si None, la graine est tiree du 
+                generateur global de numpy, ce qui respecte np.random.seed.
         """
-        self.graphe.add_nodes_from(np.arange(nbSommets))
-            
-        for i in range(nbSommets):
-            for j in range(i + 1, nbSommets):
-                if np.random.rand() <= probaArete:
-                    self.graphe.add_edge(i, j)
+        if graine is None:
+            graine = np.random.randint(2**63 - 1, dtype = np.int64)
+        rng = np.random.default_rng(graine)
+        nbPaires = nbSommets * (nbSommets - 1) // 2
+        taille = 1 << 22
+        blocs = []
+        if probaArete <= 0 or nbPaires == 0:
+            pass
+        elif probaArete < 0.2:
+            #sauts geometriques entre deux paires retenues
+            dernier = -1
+            while dernier < nbPaires:
+                nbTirages = min(taille, int(1.1 * probaArete * (nbPaires - dernier)) + 64)
+                positions = dernier + np.cumsum(rng.geometric(probaArete, nbTirages))
+                dernier = positions[-1]
+                blocs.append(positions[positions < nbPaires])
+        else:
+            #masque sur des blocs de paires consecutives
+            for debut in range(0, nbPaires, taille):
+                fin = min(debut + taille, nbPaires)
+                blocs.append(debut + np.flatnonzero(rng.random(fin - debut) < probaArete))
+        paires = np.concatenate(blocs) if blocs else np.zeros(0, dtype = np.int64)
+        #conversion du numero de paire en (i, j)
+        sommets = np.arange(nbSommets, dtype = np.int64)
+        debutsLignes = sommets * (2 * nbSommets - sommets - 1) // 2
+        i = np.searchsorted(debutsLignes, paires, side = "right") - 1
+        j = paires - debutsLignes[i] + i + 1
+        self._construire(sommets, i, j, dedoublonner = False)
+    
+    def reduire(self, k = None, plier = True):
+        """
+        Applique les regles de reduction du module reduction (sommets isoles,
+        degre 1, degre 2 et, si k est donne, regle de Buss).
+        Args :
+            k (facultatif) : taille de couverture recherchee, pour la regle de
+                Buss.
+            plier (facultatif) : si False, on ne plie pas les sommets de 
+                degre 2.
+        Returns :
+            un tuple (grapheReduit, relevement) ou relevement.relever 
+            transforme une couverture du graphe reduit en une couverture du 
+            graphe d'origine.
+        """
+        import reduction
+        return reduction.reduire(self, k, plier)
     
     def supprimerSommet(self, sommet):
         """
@@ -98,11 +505,7 @@ class Graphe:
         Returns :
             un nouveau graphe sans sommet.
         """
-        g2 = Graphe()
-        g2.graphe = nx.Graph(self.graphe)
-        g2.graphe.remove_node(sommet)
-        
-        return g2
+        return self.supprimerSommets([sommet])
         
     def supprimerSommets(self, sommets):
         """
@@ -113,11 +516,103 @@ class Graphe:
         Returns :
             un nouveau graphe sans sommets.
         """
+        garder = np.ones(self.nbSommets, dtype = bool)
+        garder[[self._indice(s) for s in sommets]] = False
+        return self._sousGraphe(garder)
+    
+    def _sousGraphe(self, garder):
+        """
+        Retourne le sous-graphe induit par les sommets d'indices i tels que 
+        garder[i] est True, en conservant l'ordre des sommets et des listes 
+        d'adjacence.
+        Args :
+            garder : tableau numpy de booleens de taille n.
+        Returns :
+            un nouveau graphe.
+        """
+        nouvelIndice = np.cumsum(garder) - 1
+        lignes = np.repeat(np.arange(self.nbSommets), self.degres)
+        entrees = garder[lignes] & garder[self.indices]
         g2 = Graphe()
-        g2.graphe = nx.Graph(self.graphe)
-        g2.graphe.remove_nodes_from(sommets)
-        return g2   
+        g2.etiquettes = self.etiquettes[garder]
+        g2.degres = np.bincount(nouvelIndice[lignes[entrees]], minlength = g2.etiquettes.size)
+        g2.indptr = np.zeros(g2.etiquettes.size + 1, dtype = np.int64)
+        np.cumsum(g2.degres, out = g2.indptr[1:])
+        g2.indices = nouvelIndice[self.indices[entrees]].astype(self.indices.dtype)
+        return g2
            
+    def _sousGrapheSommets(self, sommets):
+        """
+        Retourne le sous-graphe induit par les sommets d'indices donnes, en 
+        ne parcourant que leurs listes d'adjacence.
+        Args :
+            sommets : tableau numpy trie d'indices de sommets.
+        Returns :
+            un nouveau graphe, ou le sommet d'indice i est sommets[i].
+        """
+        sommets = np.asarray(sommets, dtype = np.int64)
+        debuts = self.indptr[sommets]
+        degres = self.indptr[sommets + 1] - debuts
+        positions = np.repeat(debuts - np.cumsum(degres) + degres, degres) + np.arange(degres.sum())
+        voisins = self.indices[positions]
+        nouveaux = np.searchsorted(sommets, voisins)
+        nouveaux[nouveaux == sommets.size] = 0
+        entrees = sommets[nouveaux] == voisins
+        lignes = np.repeat(np.arange(sommets.size), degres)
+        g2 = Graphe()
+        g2.etiquettes = self.etiquettes[sommets]
+        g2.degres = np.bincount(lignes[entrees], minlength = sommets.size)
+        g2.indptr = np.zeros(sommets.size + 1, dtype = np.int64)
+        np.cumsum(g2.degres, out = g2.indptr[1:])
+        g2.indices = nouveaux[entrees].astype(self.indices.dtype)
+        return g2
+    
+    def composantesConnexes(self, isoles = False):
+        """
+        Retourne les composantes connexes du graphe, dans l'ordre de leur 
+        premier sommet.
+        Args :
+            isoles (facultatif) : si False, les sommets isoles (qui ne sont 
+                dans aucune couverture minimale) ne sont pas retournes.
+        Returns :
+            une liste d'objets du type Graphe.
+        """
+        etat = EtatRecherche(self)
+        if isoles:
+            composantes = etat.composantes() + [[s] for s in range(self.nbSommets) 
+                                                if etat.degres[s] == 0]
+            composantes.sort(key = min)
+        else:
+            composantes = etat.composantes()
+        return [self._sousGrapheSommets(sorted(c)) for c in composantes]
+    
+    def resoudreParComposantes(self, nomMethode, processus = None, **kwargs):
+        """
+        Applique un algorithme de couverture a chaque composante connexe du 
+        graphe separement et combine les resultats.
+        Args :
+            nomMethode : nom de la methode de Graphe a appliquer.
+            processus (facultatif) : si donne, nombre de processus utilises 
+                pour resoudre les composantes en parallele.
+            **kwargs (facultatif) : arguments passes a la methode.
+        Returns :
+            le meme type de resultat que la methode : la reunion des 
+            couvertures ou, pour les algorithmes de branchement, un tuple avec
+            la reunion des couvertures et la somme des noeuds parcourus.
+        """
+        composantes = self.composantesConnexes()
+        if processus is None:
+            resultats = [getattr(c, nomMethode)(**kwargs) for c in composantes]
+        else:
+            import parallele
+            resultats = parallele.resoudreGraphes(composantes, nomMethode, kwargs, processus)
+        if not resultats:
+            return getattr(self, nomMethode)(**kwargs)
+        if isinstance(resultats[0], tuple):
+            return (set().union(*(r[0] for r in resultats)), 
+                    sum(r[1] for r in resultats))
+        return set().union(*resultats)
+    
     def degresSommet(self):
         """
         Renvoie un dictionnaire contenant les degres des sommets du graphe.
@@ -125,16 +620,16 @@ class Graphe:
             un dictionnaire ou les cles sont les sommets et les valeurs sont
             les degres.
         """
-        return dict(self.graphe.degree())
+        return dict(zip(self.etiquettes.tolist(), self.degres.tolist()))
     
     def degreMax(self):
         """
-        Retourne un sommet de degre maximum.
+        Retourne un sommet de degre maximum (le premier dans l'ordre des 
+        sommets en cas d'egalite).
         Returns : 
             un sommet de degre maximum.
         """
-        degres = self.degresSommet()
-        return max(degres, key=lambda key: degres[key])
+        return self.etiquettes[np.argmax(self.degres)].item()
     
     def voisinsSommet(self, sommet):
         """
@@ -144,7 +639,8 @@ class Graphe:
         Returns :
             un ensemble des voisins de sommet.
         """
-        return set(self.graphe[sommet])
+        i = self._indice(sommet)
+        return self._noms(self.indices[self.indptr[i]:self.indptr[i + 1]])
     
 #==============================================================================
 # Fonctions por le probleme de la couverture minimale
@@ -157,13 +653,8 @@ class Graphe:
         Returns : 
             un ensemble de sommets qui forment une couverture du graphe.
         """
-        couverture = set()
-        for arete in (self.graphe.edges):
-            i, j = arete
-            if (i not in couverture) and (j not in couverture):
-                couverture.add(i)
-                couverture.add(j)
-        return couverture
+        couvert = couplageAretes(self.tableauAretes(), self.nbSommets)
+        return self._noms(np.flatnonzero(couvert))
     
     def algoGlouton(self):
         """
@@ -176,7 +667,7 @@ class Graphe:
         """
         g = self
         couverture = set()
-        while len(g.graphe.edges) != 0:
+        while g.nbAretes != 0:
             v = g.degreMax()
             couverture.add(v)
             g = g.supprimerSommet(v)
@@ -187,65 +678,125 @@ class Graphe:
         Determine une solution approche au probleme de la couverture minimale
         (Vertex cover) en utilisant un algorithme glouton qui selectionne les 
         sommets en ordre decroissant de degres.
-        Une seule copie du graphe est faite au début et modifiée à chaque
-        étape, ce qui permet d'accélerer l'exécution.
+        Une seule copie du tableau des degres est faite au début et modifiée à 
+        chaque étape, ce qui permet d'accélerer l'exécution.
         Returns : 
             un ensemble de sommets qui forment une couverture du graphe.
         """
-        g = Graphe()
-        g.graphe = nx.Graph(self.graphe)
-        couverture = set()
-        while len(g.graphe.edges) != 0:
-            v = g.degreMax()
-            couverture.add(v)
-            g.graphe.remove_node(v)
-        return couverture
+        degres = self.degres.copy()
+        vivants = np.ones(self.nbSommets, dtype = bool)
+        m = self.nbAretes
+        couverture = []
+        while m != 0:
+            #les sommets retires ont degre 0, ils ne sont donc jamais choisis
+            v = np.argmax(degres)
+            couverture.append(v)
+            voisins = self.indices[self.indptr[v]:self.indptr[v + 1]]
+            degres[voisins[vivants[voisins]]] -= 1
+            m -= degres[v]
+            degres[v] = 0
+            vivants[v] = False
+        return self._noms(couverture)
     
-    def algoBranchement(self, debug = False):
+    def algoGloutonNiveaux(self):
+        """
+        Determine la meme couverture que algoGloutonSansCopies (et donc 
+        algoGlouton), mais en traitant d'un coup, par des operations numpy, 
+        tous les sommets retires tant que le degre maximum ne change pas (voir
+        gloutonNiveaux). Adapte aux grands graphes creux (10^6 sommets, 10^7 
+        aretes), ou le nombre de niveaux de degre est petit devant n.
+        Returns : 
+            un ensemble de sommets qui forment une couverture du graphe.
+        """
+        return self._noms(np.flatnonzero(gloutonNiveaux(self.indptr, self.indices, self.degres)))
+    
+    def algoGloutonSeaux(self):
+        """
+        Determine une solution approche au probleme de la couverture minimale
+        (Vertex cover) en utilisant un algorithme glouton qui selectionne les 
+        sommets en ordre decroissant de degres.
+        Les sommets sont ranges dans des seaux indexes par leur degre, ce qui
+        permet de trouver un sommet de degre maximum et de mettre a jour les 
+        degres en temps constant : l'algorithme est en O(n + m). En cas 
+        d'egalite, le sommet choisi est le dernier rajoute dans son seau (au
+        depart, le premier dans l'ordre des sommets), le resultat est donc 
+        deterministe.
+        Les mises a jour des seaux sont faites sommet par sommet en Python : 
+        a partir de _SEUIL_GLOUTON_NIVEAUX aretes, on calcule a la place la 
+        couverture de algoGloutonNiveaux (5 a 10 fois plus rapide des 10^5 
+        aretes, environ 13 fois pour 10^6 sommets et 10^7 aretes). Elle ne 
+        differe que par le choix en cas d'egalite (le premier sommet de degre
+        maximum dans l'ordre des sommets).
+        Returns : 
+            un ensemble de sommets qui forment une couverture du graphe.
+        """
+        if self.nbAretes >= _SEUIL_GLOUTON_NIVEAUX:
+            return self.algoGloutonNiveaux()
+        etat = EtatRecherche(self)
+        return self._noms(_gloutonSeaux(etat.voisins, etat.vivant, etat.degres))
+    
+    def ameliorerCouverture(self, couverture, tempsMax = 0.1, pasMax = None, graine = None):
+        """
+        Ameliore une couverture du graphe par la recherche locale du module 
+        rechercheLocale (poids des aretes et verification de configuration,
+        comme NuMVC).
+        Args :
+            couverture : ensemble de sommets qui forment une couverture du 
+                graphe.
+            tempsMax (facultatif) : temps maximum (en secondes, temps reel).
+            pasMax (facultatif) : nombre maximum de pas de recherche locale.
+            graine (facultatif) : graine (entier) ou objet 
+                numpy.random.Generator.
+        Returns : 
+            un ensemble de sommets qui forment une couverture du graphe, de 
+            taille au plus celle de couverture.
+        """
+        import rechercheLocale
+        return rechercheLocale.ameliorer(self, couverture, tempsMax, pasMax, graine)
+    
+    def algoRechercheLocale(self, tempsMax = 0.1, pasMax = None, graine = None):
+        """
+        Determine une solution approche au probleme de la couverture minimale
+        (Vertex cover) en ameliorant par recherche locale la couverture de 
+        algoGloutonSeaux.
+        Args :
+            tempsMax, pasMax, graine (facultatifs) : voir ameliorerCouverture.
+        Returns : 
+            un ensemble de sommets qui forment une couverture du graphe.
+        """
+        return self.ameliorerCouverture(self.algoGloutonSeaux(), tempsMax, pasMax, graine)
+    
+    @_avecCache
+    def algoBranchement(self, debug = False, statistiques = None, couvInitiale = None):
         """
         Determine une solution exacte au probleme de la couverture minimale
         (Vertex cover) en utilisant un arbre binaire de recherche.
         Args : 
             debug (facultatif) : si True, affiche des messages a chaque etape
                 montrant le fonctionnement etape a etape de l'algorithme.
+            statistiques (facultatif) : objet StatistiquesRecherche mis a jour
+                pendant la recherche (noeuds, elagages par cause, temps...).
+            couvInitiale (facultatif) : couverture de depart (ensemble de 
+                sommets) ou nom d'une heuristique qui la calcule ("couplage", 
+                "glouton", "rechercheLocale" ou "auto" pour la plus petite 
+                des couvertures de algoCouplage et algoGloutonSeaux), voir 
+                _couvertureInitiale. Seuls les algorithmes avec elagage s'en 
+                servent pour couper des branches.
         Returns : 
             Un tuple forme par un ensemble de sommets qui forment une 
             couverture minimale du graphe et les nombre des noeuds de l'arbre 
             parcourus.        
         """
-        #la pile reçoit les sommets retirés du graphe aka une couverture partielle
-        pile = []
-        #on commence avec la couverture partielle vide
-        pile.append(set())
-        #compteur de noeuds visités
-        n = 0
-        couvMin = set(self.graphe.nodes)
-        while pile != []:
-            #on retire le dernier élément qui a été mis dans la pile
-            couvPart = pile.pop()
-            #on augmente le compteur de noeuds visites
-            n += 1
-            #on cree le graphe sans les sommets dans la couverture partiel
-            gPart = self.supprimerSommets(couvPart)
-            aretes = list(gPart.graphe.edges)
-            #prints debug
-            if debug:
-                print("nombre de sommets visités :", n)
-                print("sommets dans la couverture partielle :", couvPart)
-                print("sommets restants dans le graphe partiel :", gPart.graphe.nodes)
-                print("aretes restants dans le graphe partiel :", aretes)
-            #si on a encore des aretes, on continue a empiler
-            if len(aretes) > 0:
-                u, v = aretes[0]
-                pile.append(couvPart | {v})
-                pile.append(couvPart | {u})
-            #sinon on est au cas de base, on voit si la taille de la couverture
-            #est plus petite que ce qu'on avait déjà
-            else:
-                couvMin = couvPart if len(couvPart) < len(couvMin) else couvMin
-        return couvMin, n
+        recherche = Branchement(self, brancherSommet = False, elagage = False, debug = debug,
+                                statistiques = statistiques, 
+                                couvInitiale = self._couvertureInitiale(couvInitiale))
+        recherche.executer()
+        return recherche.resultat()
     
-    def algoBranchementBorne(self, debug = False, methodeMax = 0, methodeMin = 0):
+    @_avecCache
+    def algoBranchementBorne(self, debug = False, methodeMax = 0, methodeMin = 0, 
+                             tailleTable = 0, meilleurDAbord = False, noeudsMemoire = 100000,
+                             statistiques = None, couvInitiale = None):
         """
         Determine une solution exacte au probleme de la couverture minimale
         (Vertex cover) en utilisant un arbre binaire de recherche et en coupant
@@ -257,88 +808,51 @@ class Graphe:
                 0 : BorneMax calculé par l'algorithme de couplage 
                 1 : BorneMax calculé par l'algorithme glouton
                 2 : BorneMax calculé par la solution actuelle (naive)
+                3 : BorneMax calculé par l'algorithme glouton a seaux 
+                (algoGloutonSeaux, en temps lineaire)
             methodeMin (facultatif) :
                 0 : BorneMin calculé par b1, b2, b3 
                 (avec b2 calculé par l'algorithme de couplage)
                 1 : BorneMin calculé par b1, b3
                 2 : BorneMin calculé par la couverture partielle actuelle 
                 (naive).
+                3 : BorneMin calculé par b1, b2, b3 avec b2 la taille d'un 
+                couplage maximum, mis a jour a chaque noeud (voir 
+                CouplageIncremental).
+                4 : BorneMin calculé par b1, b3 et l'optimum de la relaxation
+                lineaire (voir CouplageIncremental).
+            tailleTable (facultatif) : si strictement positif, nombre 
+                d'entrees d'une table de transposition (voir 
+                TableTransposition) qui coupe les graphes partiels deja 
+                rencontres. Ses statistiques sont gardees dans l'attribut 
+                statistiquesTable du graphe (et affichees si debug).
+            meilleurDAbord (facultatif) : si True, l'arbre est parcouru en 
+                meilleur d'abord (par borne minimale croissante) au lieu d'un
+                parcours en profondeur (voir Branchement.executerMeilleurDAbord).
+            noeudsMemoire (facultatif) : nombre maximum de noeuds en attente 
+                en meilleur d'abord, au-dela duquel on repasse en profondeur.
+            statistiques, couvInitiale (facultatifs) : voir algoBranchement.
         Returns : 
             Un tuple forme par un ensemble de sommets qui forment une 
             couverture minimale du graphe et les nombre des noeuds de l'arbre 
             parcourus.  
         """
-        #la pile reçoit les sommets retirés du graphe aka une couverture partielle
-        pile = []
-        #on commence avec la couverture partielle vide
-        pile.append(set())
-        #compteur de noeuds visités
-        cpt = 0
-        #couverture minimale actuelle
-        couvMin = set(self.graphe.nodes)
-        #borneMax pour l'elagage
-        borneMax = len(couvMin) 
-        while pile != []:
-            #on retire le dernier élément qui a été mis dans la pile
-            couvPart = pile.pop()
-            #on cree le graphe sans les sommets dans la couverture partiel
-            gPart = self.supprimerSommets(couvPart)
-            aretes = list(gPart.graphe.edges)
-            #on augmente le compteur de noeuds visites
-            cpt += 1
-            #prints debug
-            if debug:
-                print("nombre de sommets visités :", cpt)
-                print("sommets dans la couverture partielle :", couvPart)
-                print("sommets restants dans le graphe partiel :", gPart.graphe.nodes)
-                print("aretes restants dans le graphe partiel :", aretes)
-            #si on a encore des aretes, on continue a empiler
-            if len(aretes) > 0:
-                u, v = aretes[0]
-                #calcul d'une solution realisable sur le graphe partiel pour borneMax
-                if methodeMax == 0:
-                #par l'algorithme de couplage
-                    coupPart = gPart.algoCouplage()
-                elif methodeMax == 1:
-                    #par l'agorithme glouton
-                    coupPart = gPart.algoGloutonSansCopies() 
-                #mis-a-jour de la borneMax
-                if methodeMax != 2:
-                    borneMax = min(borneMax, (len(couvPart) + len(coupPart)))
-                #calcul de la borneMin
-                if methodeMin != 2:
-                    n = len(gPart.graphe.nodes)
-                    m = len(gPart.graphe.edges)              
-                    degres = gPart.degresSommet()
-                    b1 = np.ceil(m / max(degres.values()))
-                    b3 = (2 * n - 1 - np.sqrt((2 *n - 1)**2 - 8 * m)) / 2
-                    #on calcule b2 mais on n'a pas encore de couplage
-                    if methodeMin == 0 and methodeMax != 0:
-                        coupPart = gPart.algoCouplage()
-                    if methodeMin == 0:
-                        b2 = len(coupPart) / 2
-                    #on ne calcule pas b2
-                    else: 
-                        b2 = 0
-                    borneMin = len(couvPart) + max(b1, b2, b3) 
-                #borneMin naive
-                else: 
-                    borneMin = len(couvPart)
-                if debug:
-                    print("bornes :", borneMin, borneMax)
-                #on ajoute les couvertures partiels a la pile que si on a la 
-                #possibilité de trouver la solution maximale
-                if borneMin <= borneMax:
-                    pile.append(couvPart | {v})
-                    pile.append(couvPart | {u})
-            #sinon on est au cas de base, on voit si la taille de la couverture
-            #est plus petite que ce qu'on avait déjà
-            else:
-                couvMin = couvPart if len(couvPart) < len(couvMin) else couvMin
-                borneMax = len(couvMin)
-        return couvMin, cpt
+        recherche = Branchement(self, brancherSommet = False, elagage = True, debug = debug, 
+                                methodeMax = methodeMax, methodeMin = methodeMin, 
+                                tailleTable = tailleTable, statistiques = statistiques,
+                                couvInitiale = self._couvertureInitiale(couvInitiale))
+        if meilleurDAbord:
+            recherche.executerMeilleurDAbord(noeudsMemoire)
+        else:
+            recherche.executer()
+        self._garderStatistiquesTable(recherche)
+        return recherche.resultat()
     
-    def algoBranchementAmeliore(self, debug = False, sommetMax = False, elimDegre1 = False):
+    @_avecCache
+    def algoBranchementAmeliore(self, debug = False, sommetMax = False, elimDegre1 = False,
+                                reduction = False, reductionNoeuds = False, decomposer = False,
+                                methodeMin = 0, tailleTable = 0, meilleurDAbord = False, 
+                                noeudsMemoire = 100000, statistiques = None, couvInitiale = None):
         """
         Determine une solution exacte au probleme de la couverture minimale
         (Vertex cover) en utilisant un arbre binaire de recherche et en coupant
@@ -353,73 +867,1936 @@ class Graphe:
                 un sommet de degre maximal. Sinon c'est un sommet quelconque.               
             elimDegre1 (facultatif) : si True, ne cree pas une branche pour un 
             sommet de degre 1.
+            reduction (facultatif) : si True, le graphe est d'abord reduit 
+                (voir Graphe.reduire) et la recherche se fait sur le graphe
+                reduit.
+            reductionNoeuds (facultatif) : si True, les regles de degre 1 et 
+                du triangle sont appliquees a chaque noeud de l'arbre.
+            decomposer (facultatif) : si True, des que le graphe partiel 
+                n'est pas connexe (a la racine ou apres un branchement), ses
+                composantes connexes sont resolues separement.
+            methodeMin (facultatif) : calcul de la borne minimale, voir 
+                algoBranchementBorne (0 par defaut, 3 ou 4 pour les bornes par
+                couplage maximum ou relaxation lineaire).
+            tailleTable, meilleurDAbord, noeudsMemoire, statistiques 
+                (facultatifs) : voir algoBranchementBorne.
+            couvInitiale (facultatif) : voir algoBranchement. Avec reduction,
+                une couverture donnee est restreinte au graphe reduit puis 
+                completee.
         Returns : 
             Un tuple forme par un ensemble de sommets qui forment une 
             couverture minimale du graphe et les nombre des noeuds de l'arbre 
             parcourus.  
         """
-        #la pile reçoit les sommets retirés du graphe aka une couverture partielle
-        pile = []
-        #on commence avec la couverture partielle vide
-        pile.append(set())
-        #compteur de noeuds visités
-        cpt = 0
-        #couverture minimale actuelle
-        couvMin = set(self.graphe.nodes)
-        #borneMax pour l'elagage
-        borneMax = len(couvMin)
-        while pile != []:
+        if reduction:
+            grapheReduit, relevement = self.reduire()
+            couverture, cpt = grapheReduit.algoBranchementAmeliore(
+                debug, sommetMax, elimDegre1, reductionNoeuds = reductionNoeuds, 
+                decomposer = decomposer, methodeMin = methodeMin, tailleTable = tailleTable,
+                meilleurDAbord = meilleurDAbord, noeudsMemoire = noeudsMemoire, 
+                statistiques = statistiques, couvInitiale = couvInitiale)
+            self.statistiquesTable = grapheReduit.statistiquesTable
+            return relevement.relever(couverture), cpt
+        recherche = Branchement(self, brancherSommet = True, elagage = True, debug = debug, 
+                                sommetMax = sommetMax, elimDegre1 = elimDegre1,
+                                reductionNoeuds = reductionNoeuds, decomposer = decomposer,
+                                methodeMin = methodeMin, tailleTable = tailleTable,
+                                statistiques = statistiques, 
+                                couvInitiale = self._couvertureInitiale(couvInitiale))
+        if meilleurDAbord:
+            recherche.executerMeilleurDAbord(noeudsMemoire)
+        else:
+            recherche.executer()
+        self._garderStatistiquesTable(recherche)
+        return recherche.resultat()
+    
+    def _garderStatistiquesTable(self, recherche):
+        """
+        Garde dans l'attribut statistiquesTable les statistiques de la table 
+        de transposition de recherche (None si elle n'en a pas) et les affiche
+        si la recherche est en mode debug.
+        """
+        self.statistiquesTable = None
+        if recherche.table is not None:
+            self.statistiquesTable = recherche.table.statistiques()
+            if recherche.debug:
+                print("table de transposition :", self.statistiquesTable)
+    
+    def _couvertureInitiale(self, couvInitiale, tempsMax = None):
+        """
+        Retourne la couverture de depart d'une recherche exacte.
+        Args :
+            couvInitiale : None, un ensemble de sommets, le nom d'une 
+                heuristique ("couplage" pour algoCouplage, "glouton" pour 
+                algoGloutonSeaux, "rechercheLocale" pour algoRechercheLocale),
+                le nom d'une autre methode de Graphe qui retourne une 
+                couverture, ou "auto" pour la plus petite des couvertures de
+                algoCouplage et algoGloutonSeaux (toutes deux en temps 
+                lineaire). Les sommets qui ne sont pas dans le graphe sont 
+                ignores et la couverture est completee par une extremite de 
+                chaque arete non couverte.
+            tempsMax (facultatif) : temps maximum (en secondes) de la 
+                recherche locale ("rechercheLocale"), au plus sa valeur par
+                defaut.
+        Returns :
+            None si couvInitiale est None, sinon la liste des indices des 
+            sommets de la couverture.
+        """
+        if couvInitiale is None:
+            return None
+        if isinstance(couvInitiale, str):
+            if couvInitiale == "auto":
+                couvInitiale = min(self.algoCouplage(), self.algoGloutonSeaux(), key = len)
+            else:
+                nom = _HEURISTIQUES.get(couvInitiale, couvInitiale)
+                if nom == "algoRechercheLocale" and tempsMax is not None:
+                    couvInitiale = self.algoRechercheLocale(tempsMax = min(0.1, tempsMax))
+                else:
+                    couvInitiale = getattr(self, nom)()
+        if self._indiceDe is None:
+            self._indiceDe = {s: i for i, s in enumerate(self.etiquettes.tolist())}
+        dans = np.zeros(self.nbSommets, dtype = bool)
+        dans[[self._indiceDe[s] for s in couvInitiale if s in self._indiceDe]] = True
+        #on complete par la premiere extremite des aretes non couvertes
+        aretes = self.tableauAretes()
+        dans[aretes[~(dans[aretes[:, 0]] | dans[aretes[:, 1]]), 0]] = True
+        return np.flatnonzero(dans).tolist()
+    
+    def algoBranchementAnytime(self, tempsMax = None, noeudsMax = None, rappel = None, 
+                               sommetMax = False, elimDegre1 = False, reduction = False,
+                               reductionNoeuds = False, decomposer = False, methodeMin = 0,
+                               tailleTable = 0, pas = 1000, statistiques = None, 
+                               couvInitiale = None):
+        """
+        Recherche exacte de algoBranchementAmeliore qui peut etre interrompue :
+        la recherche s'arrete apres tempsMax secondes ou noeudsMax noeuds et
+        retourne la meilleure couverture trouvee, avec une borne minimale et
+        l'ecart a l'optimum.
+        Args : 
+            tempsMax (facultatif) : temps maximum (en secondes, temps reel),
+                reduction et couverture de depart comprises. Le temps est 
+                verifie tous les pas noeuds, y compris dans les recherches 
+                separees des composantes.
+            noeudsMax (facultatif) : nombre maximum de noeuds a visiter.
+            rappel (facultatif) : fonction appelee avec (couverture, noeuds) a
+                chaque fois qu'une meilleure couverture est trouvee.
+            sommetMax, elimDegre1, reduction, reductionNoeuds, decomposer, 
+                methodeMin, tailleTable, statistiques, couvInitiale 
+                (facultatifs) : voir algoBranchementAmeliore.
+            pas (facultatif) : nombre de noeuds visites entre deux 
+                verifications du temps.
+        Returns : 
+            Un objet ResultatAnytime (couverture, noeuds, borneInf, ecart, 
+            optimal) : la meilleure couverture trouvee, le nombre des noeuds
+            parcourus, une borne minimale de la taille d'une couverture 
+            minimale, l'ecart relatif (taille - borneInf) / taille et True si
+            la couverture est prouvee minimale.
+        """
+        debut = time.perf_counter()
+        if reduction:
+            grapheReduit, relevement = self.reduire()
+            if tempsMax is not None:
+                tempsMax = max(tempsMax - (time.perf_counter() - debut), 0)
+            rappelReduit = None
+            if rappel is not None:
+                def rappelReduit(couverture, noeuds):
+                    rappel(relevement.relever(couverture), noeuds)
+            res = grapheReduit.algoBranchementAnytime(
+                tempsMax, noeudsMax, rappelReduit, sommetMax, elimDegre1, 
+                reductionNoeuds = reductionNoeuds, decomposer = decomposer, 
+                methodeMin = methodeMin, tailleTable = tailleTable, pas = pas,
+                statistiques = statistiques, couvInitiale = couvInitiale)
+            couverture = relevement.relever(res.couverture)
+            borneInf = res.borneInf + relevement.decalage
+            ecart = (len(couverture) - borneInf) / len(couverture) if couverture else 0.0
+            return ResultatAnytime(couverture, res.noeuds, borneInf, ecart, res.optimal)
+        #la couverture de depart dispose d'au plus la moitie du temps
+        couvDepart = self._couvertureInitiale(couvInitiale, 
+                                              None if tempsMax is None else tempsMax / 2)
+        recherche = Branchement(self, brancherSommet = True, elagage = True, 
+                                sommetMax = sommetMax, elimDegre1 = elimDegre1,
+                                reductionNoeuds = reductionNoeuds, decomposer = decomposer,
+                                methodeMin = methodeMin, tailleTable = tailleTable,
+                                statistiques = statistiques, couvInitiale = couvDepart)
+        recherche.rappel = rappel
+        recherche.pasTemps = pas
+        recherche.noeudsLimite = noeudsMax
+        if tempsMax is not None:
+            recherche.echeance = debut + tempsMax
+        fini = recherche.executer()
+        self._garderStatistiquesTable(recherche)
+        couverture, cpt = recherche.resultat()
+        borneInf = len(couverture) if fini else recherche.borneMinGlobale()
+        ecart = (len(couverture) - borneInf) / len(couverture) if couverture else 0.0
+        return ResultatAnytime(couverture, cpt, borneInf, ecart, borneInf == len(couverture))
+    
+    @_avecCache
+    def algoBranchementBits(self, sommetMax = False, elimDegre1 = False, couvInitiale = None):
+        """
+        Determine une solution exacte au probleme de la couverture minimale
+        (Vertex cover) avec le meme branchement et les memes bornes que 
+        algoBranchementAmeliore, mais en representant les voisinages et le 
+        graphe partiel par des entiers utilises comme bitsets : retirer des 
+        sommets, calculer un degre (nombre de bits a 1) ou le voisinage d'un 
+        sommet sont des operations sur des mots machine. 
+        L'objectif d'un gain d'un ordre de grandeur sur algoBranchementAmeliore
+        n'est pas atteint : les deux parcourent les memes noeuds et le cout 
+        par noeud reste domine par l'interpreteur. Mesure (5 graphes par 
+        point, sommetMax et elimDegre1) : environ 2 fois plus rapide pour 
+        n = 30 a 45 (p = 0.3) et n = 40 (p = 0.5), 1.5 fois pour n = 60 
+        (p = 0.2), et plus lent (0.8 a 0.9 fois) pour n = 80 a 100 (p = 0.1).
+        Args : 
+            sommetMax, elimDegre1 (facultatifs) : voir algoBranchementAmeliore.
+            couvInitiale (facultatif) : voir algoBranchement.
+        Returns : 
+            Un tuple forme par un ensemble de sommets qui forment une 
+            couverture minimale du graphe et les nombre des noeuds de l'arbre 
+            parcourus.  
+        """
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        voisins = [indices[indptr[i]:indptr[i + 1]] for i in range(self.nbSommets)]
+        couverture, cpt = _branchementBits(voisins, sommetMax, elimDegre1, 
+                                           self._couvertureInitiale(couvInitiale))
+        return self._noms(couverture), cpt
+    
+    @_avecCache
+    def algoBranchementParallele(self, processus = None, sommetMax = False, 
+                                 elimDegre1 = False, noeudsParTache = 2000, 
+                                 couvInitiale = None):
+        """
+        Determine une solution exacte au probleme de la couverture minimale
+        (Vertex cover) avec le meme branchement que algoBranchementAmeliore, 
+        mais en repartissant l'arbre de recherche sur plusieurs processus qui
+        partagent la meilleure borne maximale (voir le module parallele).
+        Args : 
+            processus (facultatif) : nombre de processus, par defaut le nombre
+                de coeurs.
+            sommetMax, elimDegre1 (facultatifs) : voir algoBranchementAmeliore.
+            noeudsParTache (facultatif) : nombre de noeuds visites par une 
+                tache avant que sa pile soit redecoupee.
+            couvInitiale (facultatif) : voir algoBranchement.
+        Returns : 
+            Un tuple forme par un ensemble de sommets qui forment une 
+            couverture minimale du graphe et les nombre des noeuds de l'arbre 
+            parcourus par tous les processus.  
+        """
+        import parallele
+        options = dict(brancherSommet = True, elagage = True, sommetMax = sommetMax, 
+                       elimDegre1 = elimDegre1)
+        return parallele.branchementParallele(self, options, processus, noeudsParTache, 
+                                              couvInitiale = self._couvertureInitiale(couvInitiale))
+    
+    
+
+class Branchement:
+    """
+    Classe pour representer une recherche par separation et evaluation 
+    (branch and bound) en cours, commune aux algorithmes de branchement de 
+    Graphe. Le graphe partiel n'est jamais recopie : les sommets de la 
+    couverture partielle sont retires en place d'un objet EtatRecherche et 
+    remis lors du retour en arriere.
+    Chaque element de la pile est un tuple (marque, ajouts, debut) : la 
+    longueur de la trace du noeud pere, les sommets a retirer pour obtenir le
+    fils et le premier indice a partir duquel on cherche une arete.
+    
+    Attributs :
+        graphe : objet du type Graphe sur lequel on cherche.
+        etat : objet EtatRecherche representant le graphe partiel.
+        pile : pile des noeuds restant a visiter.
+        cpt : nombre de noeuds visites.
+        couvMin : liste des indices de la meilleure couverture trouvee (None
+            si on ne cherche que des couvertures meilleures que borneMax).
+        borneMax : borne maximale courante.
+        partage : None ou objet multiprocessing.Value contenant la meilleure
+            borne maximale connue par tous les processus.
+        table : None ou objet TableTransposition des graphes partiels deja 
+            rencontres.
+        borneMinNoeud : borne minimale du dernier noeud visite.
+        bornesPeres : dictionnaire qui associe a la longueur de la trace d'un 
+            noeud du chemin courant ayant des fils dans la pile sa borne 
+            minimale. En profondeur, ces noeuds sont les ancetres du noeud 
+            courant et sont donc identifies par la longueur de leur trace.
+        rappel : None ou fonction appelee avec (couverture, noeuds) a chaque 
+            fois qu'une couverture meilleure que couvMin est trouvee.
+        statistiques : None ou objet StatistiquesRecherche mis a jour pendant
+            la recherche.
+        bornesNoeud : tuple (b1, b2, b3) des bornes minimales du dernier noeud
+            evalue (sans la couverture partielle).
+        echeance : None ou instant (time.perf_counter) apres lequel executer
+            s'arrete, verifie tous les pasTemps noeuds.
+        noeudsLimite : None ou nombre total de noeuds (cpt) apres lequel 
+            executer s'arrete.
+        interrompu : True si le dernier appel a executer a ete arrete par 
+            echeance ou noeudsLimite.
+    """
+    
+    def __init__(self, graphe, brancherSommet, elagage, debug = False, methodeMax = 0, 
+                 methodeMin = 0, sommetMax = False, elimDegre1 = False, 
+                 reductionNoeuds = False, decomposer = False, tailleTable = 0, 
+                 statistiques = None, pile = None, partage = None, couvInitiale = None):
+        """
+        Args :
+            graphe : objet du type Graphe.
+            brancherSommet : si False, on branche sur les deux extremites de la
+                premiere arete (algoBranchement, algoBranchementBorne). Sinon,
+                on branche sur un sommet et ses voisins (algoBranchementAmeliore).
+            elagage : si True, on coupe des branches a l'aide des bornes.
+            debug, methodeMax, methodeMin, sommetMax, elimDegre1, 
+                reductionNoeuds, decomposer, tailleTable, statistiques 
+                (facultatifs) : voir Graphe.algoBranchementBorne et 
+                Graphe.algoBranchementAmeliore. 
+            pile (facultatif) : pile initiale, par defaut la racine seule.
+            partage (facultatif) : borne maximale partagee entre processus.
+            couvInitiale (facultatif) : liste des indices d'une couverture du
+                graphe, meilleure solution de depart (voir 
+                Graphe._couvertureInitiale).
+        """
+        self.graphe = graphe
+        self.etat = EtatRecherche(graphe)
+        self.brancherSommet = brancherSommet
+        self.elagage = elagage
+        self.debug = debug
+        self.methodeMax = methodeMax
+        self.methodeMin = methodeMin
+        self.sommetMax = sommetMax
+        self.elimDegre1 = elimDegre1
+        self.reductionNoeuds = reductionNoeuds
+        self.decomposer = decomposer
+        self.pile = [(0, (), 0)] if pile is None else pile
+        self.partage = partage
+        if methodeMin in (3, 4):
+            CouplageIncremental(self.etat, biparti = methodeMin == 4)
+        self.table = None
+        if tailleTable > 0:
+            self.table = TableTransposition(tailleTable)
+            self.etat.suivreMasque()
+        self.cpt = 0
+        self.borneMinNoeud = 0
+        self.bornesPeres = {}
+        self.bornesNoeud = (0, 0, 0)
+        self.rappel = None
+        self.statistiques = statistiques
+        self.echeance = None
+        self.pasTemps = 256
+        self.noeudsLimite = None
+        self.interrompu = False
+        self.couvMin = list(range(graphe.nbSommets))
+        if couvInitiale is not None:
+            self.couvMin = list(couvInitiale)
+        self.borneMax = len(self.couvMin)
+        
+    def resultat(self):
+        """
+        Retourne un tuple forme par l'ensemble des sommets de la meilleure 
+        couverture trouvee et le nombre des noeuds de l'arbre parcourus.
+        """
+        return self.graphe._noms(self.couvMin), self.cpt
+    
+    def pileAbsolue(self):
+        """
+        Retourne les noeuds restant dans la pile sous une forme independante
+        de la trace, (0, couverture partielle, debut), du bas vers le haut.
+        """
+        retires = self.etat.retires
+        return [(0, tuple(retires[:marque]) + ajouts, debut) 
+                for marque, ajouts, debut in self.pile]
+    
+    def _majBorneMax(self, borneMax):
+        """
+        Met a jour la borne maximale locale et, si besoin, la borne partagee.
+        """
+        self.borneMax = borneMax
+        if self.partage is not None:
+            with self.partage.get_lock():
+                if borneMax < self.partage.value:
+                    self.partage.value = borneMax
+                else:
+                    self.borneMax = min(borneMax, self.partage.value)
+    
+    def executer(self, noeudsMax = None):
+        """
+        Parcourt l'arbre de recherche en profondeur jusqu'a vider la pile ou 
+        avoir visite noeudsMax noeuds de plus, ou jusqu'a depasser echeance 
+        ou noeudsLimite (l'attribut interrompu est alors True). Ces limites 
+        s'appliquent aussi aux recherches separees des composantes.
+        Args :
+            noeudsMax (facultatif) : nombre maximum de noeuds a visiter.
+        Returns :
+            True si la pile est vide, c'est-a-dire si la recherche est finie.
+        """
+        etat = self.etat
+        pile = self.pile
+        stats = self.statistiques
+        if stats is not None:
+            stats.demarrer()
+        fin = None if noeudsMax is None else self.cpt + noeudsMax
+        self.interrompu = False
+        prochainTest = self.cpt
+        while pile != [] and (fin is None or self.cpt < fin):
+            if self.noeudsLimite is not None and self.cpt >= self.noeudsLimite:
+                self.interrompu = True
+            elif self.echeance is not None and self.cpt >= prochainTest:
+                prochainTest = self.cpt + self.pasTemps
+                self.interrompu = time.perf_counter() >= self.echeance
+            if self.interrompu:
+                break
             #on retire le dernier élément qui a été mis dans la pile
-            couvPart = pile.pop()
-            #on cree le graphe sans les sommets dans la couverture partiel
-            gPart = self.supprimerSommets(couvPart)
-            aretes = list(gPart.graphe.edges)
-            #on augmente le compteur de noeuds visites
-            cpt += 1
-            #prints debug
+            marque, ajouts, debut = pile.pop()
+            fils = self._visiter(marque, ajouts, debut)
+            if self.interrompu:
+                #recherche d'une composante interrompue : le noeud sera 
+                #visite de nouveau, la table ne doit donc pas le couper
+                if self.table is not None:
+                    self.table.oublier(etat.masque)
+                pile.append((marque, ajouts, debut))
+                break
+            taillePart = len(etat.retires)
+            if fils:
+                self.bornesPeres[taillePart] = self.borneMinNoeud
+            for ajoutsFils, debutFils in fils:
+                pile.append((taillePart, ajoutsFils, debutFils))
+            if stats is not None and len(pile) > stats.pileMax:
+                stats.pileMax = len(pile)
+        if stats is not None:
+            stats.arreter()
+        return pile == []
+    
+    def executerMeilleurDAbord(self, noeudsMemoire = 100000):
+        """
+        Parcourt l'arbre de recherche en meilleur d'abord : les noeuds en 
+        attente sont dans une file de priorite ordonnee par la borne minimale
+        de leur pere (puis du plus profond au moins profond). Un noeud dont la
+        borne minimale depasse borneMax quand il sort de la file n'est pas 
+        visite. Comme chaque noeud en attente garde sa couverture partielle 
+        entiere, la file est limitee a noeudsMemoire noeuds : quand elle est
+        pleine, le sous-arbre du meilleur noeud est parcouru en profondeur 
+        (voir executer) avant de continuer.
+        Args :
+            noeudsMemoire (facultatif) : nombre maximum de noeuds en attente.
+        """
+        etat = self.etat
+        stats = self.statistiques
+        if stats is not None:
+            stats.demarrer()
+        #file de tuples (borneMin, -profondeur, ordre, couverture, debut)
+        file = [(0, 0, 0, (), 0)]
+        self.pile = []
+        ordre = 1
+        while file:
+            borneMin, _, _, partielle, debut = heapq.heappop(file)
+            if self.elagage:
+                if self.partage is not None:
+                    self.borneMax = min(self.borneMax, self.partage.value)
+                if borneMin > self.borneMax:
+                    if stats is not None:
+                        stats.elaguer("file")
+                    continue
+            if len(file) >= noeudsMemoire:
+                #memoire pleine : parcours en profondeur du sous-arbre
+                self.pile.append((0, partielle, debut))
+                self.executer()
+                continue
+            #on ne defait la trace que jusqu'au plus long prefixe commun avec
+            #la couverture partielle du noeud (souvent le pere)
+            retires = etat.retires
+            marque = 0
+            fin = min(len(retires), len(partielle))
+            while marque < fin and retires[marque] == partielle[marque]:
+                marque += 1
+            fils = self._visiter(marque, partielle[marque:], debut)
+            partielle = tuple(retires)
+            for ajouts, debutFils in fils:
+                heapq.heappush(file, (self.borneMinNoeud, -len(partielle) - len(ajouts), 
+                                      ordre, partielle + ajouts, debutFils))
+                ordre += 1
+            if stats is not None and len(file) > stats.pileMax:
+                stats.pileMax = len(file)
+        if stats is not None:
+            stats.arreter()
+    
+    def _visiter(self, marque, ajouts, debut):
+        """
+        Visite un noeud de l'arbre : remet le graphe partiel dans l'etat du 
+        pere (trace de longueur marque), retire les sommets ajouts, calcule 
+        les bornes et retourne les fils a visiter. La borne minimale du noeud
+        est gardee dans l'attribut borneMinNoeud.
+        Args :
+            marque, ajouts, debut : element de la pile (voir la classe).
+        Returns :
+            la liste des fils (ajouts, debut), dans l'ordre ou ils doivent 
+            etre empiles (vide pour une feuille ou un noeud elague).
+        """
+        etat = self.etat
+        debug = self.debug
+        stats = self.statistiques
+        #on remet le graphe partiel dans l'etat du pere puis on retire les
+        #nouveaux sommets de la couverture partielle
+        etat.restaurer(marque)
+        for s in ajouts:
+            etat.retirer(s)
+        if self.reductionNoeuds:
+            if marque == 0 and not ajouts:
+                etat.reduire(range(self.graphe.nbSommets))
+            else:
+                etat.reduire([w for s in ajouts for w in etat.voisins[s]])
+        taillePart = len(etat.retires)
+        self.borneMinNoeud = taillePart
+        #on augmente le compteur de noeuds visites
+        self.cpt += 1
+        if stats is not None:
+            stats.visiter(taillePart, self)
+        #prints debug
+        if debug:
+            print("nombre de sommets visités :", self.cpt)
+            print("sommets dans la couverture partielle :", self.graphe._noms(etat.retires))
+            print("sommets restants dans le graphe partiel :", etat.sommetsVivants())
+            print("aretes restants dans le graphe partiel :", etat.aretesVivantes())
+        #sans aretes on est au cas de base, on voit si la taille de la 
+        #couverture est plus petite que ce qu'on avait déjà
+        if etat.nbAretes == 0:
+            if stats is not None:
+                stats.feuilles += 1
+            self._feuille(list(etat.retires))
+            return []
+        #si le meme graphe partiel (donc la meme couverture partielle) a deja
+        #ete atteint, son sous-arbre est deja traite
+        if self.table is not None and self.table.dejaVu(etat.masque):
             if debug:
-                print("nombre de sommets visités :", cpt)
-                print("sommets dans la couverture partielle :", couvPart)
-                print("sommets restants dans le graphe partiel :", gPart.graphe.nodes)
-                print("aretes restants dans le graphe partiel :", aretes)
-            #si on a encore des aretes, on continue a empiler
-            if len(aretes) > 0:
-                #on prend le sommet de plus grand degré
-                if sommetMax:
-                    u = gPart.degreMax()    
-                else:
-                    u, _ = aretes[0]
-                #calcul d'une solution realisable sur le graphe partiel pour borneMax
-                #par l'algorithme de couplage
-                coupPart = gPart.algoCouplage()
-                #mis-a-jour de la borneMax
-                borneMax = min(borneMax, (len(couvPart) + len(coupPart)))
-                #calcul de la borneMin
-                n = len(gPart.graphe.nodes)
-                m = len(gPart.graphe.edges)                
-                degres = gPart.degresSommet()
-                b1 = np.ceil(m / max(degres.values()))
-                b3 = (2 * n - 1 - np.sqrt((2 *n - 1)**2 - 8 * m)) / 2
-                b2 = len(coupPart) / 2
-                borneMin = len(couvPart) + max(b1, b2, b3)                  
-                if debug:
-                    print("bornes :", borneMin, borneMax)
-                #on ajoute les couvertures partiels a la pile que si on a la 
-                #possibilité de trouver la solution maximale
-                if borneMin <= borneMax:
-                    #on ajoute les voisins de u
-                    pile.append(couvPart | gPart.voisinsSommet(u))
-                    #eliminations de sommet de degre 1
-                    if degres[u] != 1 or not elimDegre1:
-                        pile.append(couvPart | {u})
-            #sinon on est au cas de base, on voit si la taille de la couverture
-            #est plus petite que ce qu'on avait déjà
+                print("graphe partiel deja rencontre")
+            if stats is not None:
+                stats.elaguer("table")
+            return []
+        debut = etat.premierSommet(debut)
+        u = etat.sommetDegreMax() if self.sommetMax else debut
+        if self.elagage:
+            if self.partage is not None:
+                self.borneMax = min(self.borneMax, self.partage.value)
+            borneMaxPere = self.borneMax
+            if stats is None:
+                borneMin, borneMax = self._bornes(taillePart)
             else:
-                couvMin = couvPart if len(couvPart) < len(couvMin) else couvMin
-                borneMax = len(couvMin)
-        return couvMin, cpt
+                debutBornes = time.perf_counter()
+                borneMin, borneMax = self._bornes(taillePart)
+                stats.tempsBornes += time.perf_counter() - debutBornes
+            self.borneMinNoeud = borneMin
+            if borneMax < self.borneMax:
+                self._majBorneMax(borneMax)
+            if debug:
+                print("bornes :", borneMin, self.borneMax)
+            #on n'ajoute les fils a la pile que si on a la possibilité 
+            #de trouver la solution maximale
+            if borneMin > self.borneMax:
+                if stats is not None:
+                    stats.elaguer(self._causeElagage(borneMin, borneMaxPere))
+                return []
+        #si le graphe partiel n'est pas connexe, chaque composante est 
+        #resolue separement et le noeud devient une feuille
+        if self.decomposer:
+            composantes = etat.composantes()
+            if len(composantes) > 1:
+                couverture = self._resoudreComposantes(composantes)
+                if couverture is not None:
+                    self._feuille(couverture)
+                elif stats is not None and not self.interrompu:
+                    stats.elaguer("composantes")
+                return []
+        if self.brancherSommet:
+            #on ajoute les voisins de u
+            fils = [(tuple(etat.voisinsVivants(u)), debut)]
+            #eliminations de sommet de degre 1
+            if etat.degres[u] != 1 or not self.elimDegre1:
+                fils.append(((u,), debut))
+            return fils
+        v = etat.premierVoisin(u)
+        return [((v,), debut), ((u,), debut)]
     
+    def _causeElagage(self, borneMin, borneMaxPere):
+        """
+        Retourne la cause de l'elagage du noeud courant : "borneMax" si la 
+        borne minimale ne depassait pas la borne maximale avant son calcul au
+        noeud, sinon la plus grande des bornes minimales ("b1", "b2", "b3", 
+        ou "partielle" pour la borne naive).
+        """
+        if borneMin <= borneMaxPere:
+            return "borneMax"
+        if self.methodeMin == 2:
+            return "partielle"
+        b1, b2, b3 = self.bornesNoeud
+        if b1 >= b2 and b1 >= b3:
+            return "b1"
+        return "b2" if b2 >= b3 else "b3"
+    
+    def borneMinGlobale(self):
+        """
+        Calcule une borne minimale de la taille d'une couverture minimale du 
+        graphe a partir de la recherche en cours : le minimum de la taille de
+        couvMin et des bornes minimales des peres des noeuds restant dans la 
+        pile (voir bornesPeres).
+        Returns :
+            un entier, egal a la taille de couvMin si la recherche est finie.
+        """
+        borne = self.borneMax if self.couvMin is None else len(self.couvMin)
+        for marque, _, _ in self.pile:
+            borne = min(borne, math.ceil(self.bornesPeres.get(marque, 0)))
+        return borne
+    
+    def _feuille(self, couverture):
+        """
+        Traite une couverture complete trouvee dans l'arbre : on voit si elle 
+        est plus petite que ce qu'on avait déjà.
+        Args :
+            couverture : liste des indices des sommets de la couverture.
+        """
+        if self.couvMin is None or len(couverture) < len(self.couvMin):
+            self.couvMin = couverture
+            if self.rappel is not None:
+                self.rappel(self.graphe._noms(couverture), self.cpt)
+        self._majBorneMax(len(self.couvMin))
+    
+    def _resoudreComposantes(self, composantes):
+        """
+        Resout exactement chaque composante du graphe partiel par une 
+        recherche separee avec les memes options. Chaque recherche ne cherche
+        que des couvertures assez petites pour battre borneMax, compte tenu 
+        des couvertures deja trouvees et d'une borne minimale (un couplage) 
+        pour les composantes restantes. Les noeuds parcourus par les 
+        recherches separees sont comptes.
+        Args :
+            composantes : liste de listes d'indices (voir 
+                EtatRecherche.composantes).
+        Returns :
+            la couverture complete obtenue (couverture partielle et 
+            couvertures des composantes), ou None si elle ne peut pas etre
+            plus petite que borneMax.
+        """
+        sousGraphes = []
+        for composante in sorted(composantes, key = len):
+            composante.sort()
+            sousGraphe = self.graphe._sousGrapheSommets(composante)
+            couplage = np.flatnonzero(couplageAretes(sousGraphe.tableauAretes(), 
+                                                     sousGraphe.nbSommets))
+            sousGraphes.append((composante, sousGraphe, couplage))
+        couverture = list(self.etat.retires)
+        reste = sum(couplage.size // 2 for _, _, couplage in sousGraphes)
+        for numero, (composante, sousGraphe, couplage) in enumerate(sousGraphes):
+            reste -= couplage.size // 2
+            recherche = Branchement(sousGraphe, self.brancherSommet, self.elagage, 
+                                    methodeMax = self.methodeMax, methodeMin = self.methodeMin,
+                                    sommetMax = self.sommetMax, elimDegre1 = self.elimDegre1,
+                                    reductionNoeuds = self.reductionNoeuds, decomposer = True,
+                                    tailleTable = 0 if self.table is None else self.table.tailleMax,
+                                    statistiques = self.statistiques)
+            if self.elagage:
+                recherche.borneMax = self.borneMax - len(couverture) - reste
+                recherche.couvMin = None
+            recherche.echeance = self.echeance
+            recherche.pasTemps = self.pasTemps
+            if self.noeudsLimite is not None:
+                recherche.noeudsLimite = max(self.noeudsLimite - self.cpt, 0)
+            recherche.executer()
+            self.cpt += recherche.cpt
+            if self.table is not None:
+                self.table.ajouterStatistiques(recherche.table)
+            if recherche.interrompu:
+                #on garde la meilleure couverture connue de chaque composante
+                #(celle du couplage si la recherche n'en a pas trouve)
+                self.interrompu = True
+                for i, (composante, _, couplage) in enumerate(sousGraphes[numero:]):
+                    locale = recherche.couvMin if i == 0 and recherche.couvMin is not None else couplage
+                    couverture.extend(composante[j] for j in locale)
+                if self.couvMin is None or len(couverture) < len(self.couvMin):
+                    self._feuille(couverture)
+                return None
+            if recherche.couvMin is None:
+                return None
+            couverture.extend(composante[i] for i in recherche.couvMin)
+        return couverture
+    
+    def _bornes(self, taillePart):
+        """
+        Calcule les bornes utilisees pour l'elagage au noeud courant.
+        Args :
+            taillePart : taille de la couverture partielle.
+        Returns :
+            un tuple (borneMin, borneMax) avec la nouvelle borne maximale.
+        """
+        etat = self.etat
+        borneMax = self.borneMax
+        #calcul d'une solution realisable sur le graphe partiel pour borneMax
+        tailleCouplage = None
+        if self.methodeMax == 0:
+            #par l'algorithme de couplage
+            tailleCouplage = len(etat.couplage())
+            borneMax = min(borneMax, taillePart + tailleCouplage)
+        elif self.methodeMax == 1:
+            #par l'agorithme glouton
+            borneMax = min(borneMax, taillePart + etat.tailleGlouton())
+        elif self.methodeMax == 3:
+            #par l'agorithme glouton a seaux
+            borneMax = min(borneMax, taillePart + len(_gloutonSeaux(etat.voisins, 
+                                                                    etat.vivant, etat.degres)))
+        #borneMin naive
+        if self.methodeMin == 2:
+            return taillePart, borneMax
+        #n, m et le degre maximum sont tenus a jour par etat
+        n = etat.nbVivants
+        m = etat.nbAretes
+        b1 = math.ceil(m / etat.degreMaximum)
+        b3 = (2 * n - 1 - math.sqrt((2 * n - 1)**2 - 8 * m)) / 2
+        if self.methodeMin == 0:
+            #on calcule b2 si on n'a pas encore de couplage
+            if tailleCouplage is None:
+                tailleCouplage = len(etat.couplage())
+            b2 = tailleCouplage / 2
+        elif self.methodeMin == 3:
+            #b2 par un couplage maximum
+            b2 = etat.couplageMaximum.taille
+        elif self.methodeMin == 4:
+            #relaxation lineaire, dont l'optimum est demi-entier
+            b2 = (etat.couplageMaximum.taille + 1) // 2
+        #on ne calcule pas b2
+        else:
+            b2 = 0
+        self.bornesNoeud = (b1, b2, b3)
+        return taillePart + max(b1, b2, b3), borneMax
+    
+    
+class TableTransposition:
+    """
+    Classe pour representer une table de transposition bornee d'une recherche
+    par branchement, qui garde les graphes partiels deja visites, identifies
+    par le masque des sommets retires (voir EtatRecherche.masque). 
+    Les sommets retires sont exactement la couverture partielle : deux noeuds
+    de meme masque ont donc le meme graphe partiel et la meme couverture 
+    partielle, c'est-a-dire le meme sous-arbre et les memes bornes. Quand un 
+    masque est atteint a nouveau, la premiere visite a deja traite ce 
+    sous-arbre : en profondeur (executer), il a ete entierement parcouru 
+    (ses noeuds ont strictement plus de sommets retires) ; en meilleur 
+    d'abord (executerMeilleurDAbord), les fils ont ete mis dans la file ou 
+    parcourus en profondeur, ou elagues par une borne qui reste valable car 
+    borneMax ne fait que diminuer. Le second noeud peut donc etre coupe dans
+    les deux parcours. Quand la table est pleine, l'entree utilisee le moins
+    recemment est supprimee (LRU).
+    
+    Attributs :
+        tailleMax : nombre maximum d'entrees.
+        entrees : dictionnaire ordonne dont les cles sont les masques, de 
+            l'entree la moins recemment utilisee a la plus recente.
+        succes : nombre de graphes partiels trouves dans la table et coupes.
+        echecs : nombre de graphes partiels absents de la table.
+        suppressions : nombre d'entrees supprimees faute de place.
+    """
+    
+    def __init__(self, tailleMax):
+        """
+        Args :
+            tailleMax : nombre maximum d'entrees de la table.
+        """
+        self.tailleMax = tailleMax
+        self.entrees = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+        self.suppressions = 0
+        
+    def dejaVu(self, masque):
+        """
+        Cherche le graphe partiel masque dans la table et l'enregistre s'il 
+        n'y est pas.
+        Args :
+            masque : entier representant les sommets retires.
+        Returns :
+            True si le noeud peut etre coupe.
+        """
+        entrees = self.entrees
+        if masque in entrees:
+            entrees.move_to_end(masque)
+            self.succes += 1
+            return True
+        if len(entrees) >= self.tailleMax:
+            entrees.popitem(last = False)
+            self.suppressions += 1
+        entrees[masque] = None
+        self.echecs += 1
+        return False
+    
+    def oublier(self, masque):
+        """
+        Retire le graphe partiel masque de la table, pour un noeud qui sera 
+        visite de nouveau (recherche interrompue, voir Branchement.executer).
+        """
+        self.entrees.pop(masque, None)
+    
+    def ajouterStatistiques(self, autre):
+        """
+        Ajoute aux compteurs ceux d'une autre table (par exemple celle d'une
+        recherche sur une composante connexe).
+        """
+        self.succes += autre.succes
+        self.echecs += autre.echecs
+        self.suppressions += autre.suppressions
+    
+    def statistiques(self):
+        """
+        Retourne un dictionnaire avec le nombre de succes, d'echecs, de 
+        suppressions, d'entrees et le taux de succes.
+        """
+        total = self.succes + self.echecs
+        return {"succes": self.succes, "echecs": self.echecs, 
+                "suppressions": self.suppressions, "entrees": len(self.entrees),
+                "taux": self.succes / total if total else 0.0}
+    
+    
+class StatistiquesRecherche:
+    """
+    Classe pour collecter des statistiques sur une recherche par branchement,
+    passee en argument statistiques des algorithmes de branchement. Sans cet
+    argument, la recherche ne fait aucune mesure.
+    
+    Attributs :
+        noeuds : nombre de noeuds visites.
+        feuilles : nombre de feuilles (graphe partiel sans aretes) atteintes.
+        elagages : dictionnaire qui associe a chaque cause le nombre de 
+            noeuds elagues : "b1", "b2", "b3" ou "partielle" (la borne 
+            minimale qui depasse la borne maximale), "borneMax" (la borne 
+            maximale calculee au noeud lui-meme), "table" (table de 
+            transposition), "composantes" (composantes connexes sans 
+            meilleure solution) et "file" (noeud en attente du parcours en 
+            meilleur d'abord, elague a sa sortie de la file).
+        pileMax : taille maximale de la pile (ou de la file).
+        profondeurs : dictionnaire qui associe a chaque taille de couverture
+            partielle le nombre de noeuds visites avec cette taille.
+        tempsBornes : temps (en secondes) passe dans le calcul des bornes.
+        tempsTotal : temps total de la recherche, en secondes.
+        echantillonnage : None ou fonction appelee avec (statistiques, 
+            recherche) tous les periode noeuds, recherche etant l'objet 
+            Branchement en cours.
+        periode : nombre de noeuds entre deux appels a echantillonnage.
+    """
+    
+    def __init__(self, echantillonnage = None, periode = 1000):
+        self.noeuds = 0
+        self.feuilles = 0
+        self.elagages = {}
+        self.pileMax = 0
+        self.profondeurs = {}
+        self.tempsBornes = 0.0
+        self.tempsTotal = 0.0
+        self.echantillonnage = echantillonnage
+        self.periode = periode
+        self._niveau = 0
+        self._debut = 0.0
+        
+    @property
+    def tempsBranchement(self):
+        """
+        Temps passe hors du calcul des bornes, en secondes.
+        """
+        return self.tempsTotal - self.tempsBornes
+    
+    def demarrer(self):
+        """
+        Debut d'un parcours. Les parcours imbriques (composantes connexes, 
+        repli en profondeur) ne sont chronometres qu'une fois.
+        """
+        if self._niveau == 0:
+            self._debut = time.perf_counter()
+        self._niveau += 1
+        
+    def arreter(self):
+        """
+        Fin d'un parcours commence par demarrer.
+        """
+        self._niveau -= 1
+        if self._niveau == 0:
+            self.tempsTotal += time.perf_counter() - self._debut
+    
+    def visiter(self, taillePart, recherche):
+        """
+        Compte un noeud visite avec une couverture partielle de taille 
+        taillePart et appelle echantillonnage si besoin.
+        """
+        self.noeuds += 1
+        self.profondeurs[taillePart] = self.profondeurs.get(taillePart, 0) + 1
+        if self.echantillonnage is not None and self.noeuds % self.periode == 0:
+            self.echantillonnage(self, recherche)
+    
+    def elaguer(self, cause):
+        """
+        Compte un noeud elague pour la raison cause.
+        """
+        self.elagages[cause] = self.elagages.get(cause, 0) + 1
+    
+    def resume(self):
+        """
+        Retourne un dictionnaire avec toutes les statistiques.
+        """
+        return {"noeuds": self.noeuds, "feuilles": self.feuilles, 
+                "elagages": dict(self.elagages), "pileMax": self.pileMax,
+                "profondeurs": dict(sorted(self.profondeurs.items())),
+                "tempsBornes": self.tempsBornes, "tempsBranchement": self.tempsBranchement,
+                "tempsTotal": self.tempsTotal}
+    
+    
+class CouplageIncremental:
+    """
+    Classe pour maintenir un couplage maximum du graphe partiel d'un objet 
+    EtatRecherche pendant une recherche, sans le recalculer a chaque noeud.
+    Quand un sommet couple v est retire, son partenaire w devient libre et, 
+    s'il existe un couplage plus grand, il existe un chemin augmentant partant
+    de w. De meme, quand v est remis, seul un chemin augmentant partant de v 
+    peut agrandir le couplage. Chaque mise a jour demande donc une seule 
+    recherche de chemin augmentant (algorithme d'Edmonds, avec contraction 
+    des fleurs).
+    Si biparti est True, le couplage est calcule dans le revetement biparti 
+    du graphe (deux copies g et d de chaque sommet, une arete (g_u, d_v) pour
+    chaque arete (u, v)) : sa taille est le double de l'optimum de la 
+    relaxation lineaire de la couverture minimale.
+    
+    Attributs :
+        etat : objet EtatRecherche suivi.
+        biparti : True pour le revetement biparti.
+        partenaire : partenaire de chaque sommet (-1 si libre). Dans le cas 
+            biparti, partenaire de chaque copie g.
+        partenaireD : partenaire de chaque copie d (cas biparti).
+        vivantG, vivantD : presence des copies g et d (cas biparti).
+        taille : nombre d'aretes du couplage.
+    """
+    
+    def __init__(self, etat, biparti = False):
+        """
+        Calcule un couplage maximum du graphe partiel de etat et s'enregistre
+        aupres de etat pour etre mis a jour a chaque retrait ou remise.
+        """
+        self.etat = etat
+        self.biparti = biparti
+        n = len(etat.vivant)
+        self.partenaire = [-1] * n
+        self.partenaireD = [-1] * n
+        self.vivantG = [False] * n
+        self.vivantD = [False] * n
+        self.taille = 0
+        for v in range(n):
+            if etat.vivant[v]:
+                self.remettre(v)
+        etat.couplageMaximum = self
+    
+    def retirer(self, v):
+        """
+        Met a jour le couplage apres le retrait du sommet v. Dans le cas 
+        biparti, les copies g et d sont retirees l'une apres l'autre.
+        """
+        if self.biparti:
+            for gauche in (True, False):
+                memes, autres = self._cotes(gauche)
+                (self.vivantG if gauche else self.vivantD)[v] = False
+                w = memes[v]
+                if w != -1:
+                    memes[v] = autres[w] = -1
+                    self.taille -= 1
+                    self._augmenterBiparti(w, not gauche)
+        else:
+            w = self.partenaire[v]
+            if w != -1:
+                self.partenaire[v] = self.partenaire[w] = -1
+                self.taille -= 1
+                self._augmenter(w)
+    
+    def remettre(self, v):
+        """
+        Met a jour le couplage apres la remise du sommet v.
+        """
+        if self.biparti:
+            for gauche in (True, False):
+                (self.vivantG if gauche else self.vivantD)[v] = True
+                if self._cotes(gauche)[0][v] == -1:
+                    self._augmenterBiparti(v, gauche)
+        elif self.partenaire[v] == -1:
+            self._augmenter(v)
+    
+    def _cotes(self, gauche):
+        """
+        Retourne les partenaires des copies du cote de gauche et de l'autre 
+        cote.
+        """
+        if gauche:
+            return self.partenaire, self.partenaireD
+        return self.partenaireD, self.partenaire
+    
+    def _augmenterBiparti(self, s, gauche):
+        """
+        Cherche, par un parcours en largeur, un chemin augmentant partant de la 
+        copie libre s (copie g si gauche est True, d sinon) et augmente le 
+        couplage s'il en existe un.
+        """
+        voisins = self.etat.voisins
+        memes, autres = self._cotes(gauche)
+        vivantAutres = self.vivantD if gauche else self.vivantG
+        parent = {}
+        file = [s]
+        for x in file:
+            for y in voisins[x]:
+                if not vivantAutres[y] or y in parent:
+                    continue
+                parent[y] = x
+                if autres[y] == -1:
+                    #on inverse le chemin s - ... - x - y
+                    while True:
+                        x = parent[y]
+                        precedent = memes[x]
+                        memes[x] = y
+                        autres[y] = x
+                        if x == s:
+                            break
+                        y = precedent
+                    self.taille += 1
+                    return True
+                file.append(autres[y])
+        return False
+    
+    def _augmenter(self, racine):
+        """
+        Cherche un chemin augmentant partant du sommet libre racine dans le 
+        graphe partiel (algorithme d'Edmonds) et augmente le couplage s'il en
+        existe un.
+        """
+        vivant = self.etat.vivant
+        voisins = self.etat.voisins
+        partenaire = self.partenaire
+        n = len(vivant)
+        base = list(range(n))
+        pere = [-1] * n
+        dansFile = [False] * n
+        dansFile[racine] = True
+        file = [racine]
+        
+        def ancetreCommun(a, b):
+            vus = set()
+            while True:
+                a = base[a]
+                vus.add(a)
+                if partenaire[a] == -1:
+                    break
+                a = pere[partenaire[a]]
+            while True:
+                b = base[b]
+                if b in vus:
+                    return b
+                b = pere[partenaire[b]]
+        
+        def marquerChemin(v, b, enfant, fleur):
+            while base[v] != b:
+                fleur.add(base[v])
+                fleur.add(base[partenaire[v]])
+                pere[v] = enfant
+                enfant = partenaire[v]
+                v = pere[partenaire[v]]
+        
+        for v in file:
+            for w in voisins[v]:
+                if not vivant[w] or base[v] == base[w] or partenaire[v] == w:
+                    continue
+                if w == racine or (partenaire[w] != -1 and pere[partenaire[w]] != -1):
+                    #contraction de la fleur
+                    b = ancetreCommun(v, w)
+                    fleur = set()
+                    marquerChemin(v, b, w, fleur)
+                    marquerChemin(w, b, v, fleur)
+                    for i in range(n):
+                        if vivant[i] and base[i] in fleur:
+                            base[i] = b
+                            if not dansFile[i]:
+                                dansFile[i] = True
+                                file.append(i)
+                elif pere[w] == -1:
+                    pere[w] = v
+                    if partenaire[w] == -1:
+                        #on inverse le chemin jusqu'a la racine
+                        while w != -1:
+                            precedent = partenaire[pere[w]]
+                            partenaire[w] = pere[w]
+                            partenaire[pere[w]] = w
+                            w = precedent
+                        self.taille += 1
+                        return True
+                    dansFile[partenaire[w]] = True
+                    file.append(partenaire[w])
+        return False
+    
+    
+class EtatRecherche:
+    """
+    Classe pour representer le graphe partiel d'un algorithme de branchement.
+    Les sommets sont retires en place et empiles dans une trace, ce qui 
+    permet de revenir a un etat precedent en ne reparcourant que les voisins
+    des sommets remis dans le graphe.
+    
+    Attributs :
+        voisins : listes d'adjacence (indices internes) du graphe d'origine.
+        vivant : liste de booleens, True si le sommet est encore present.
+        degres : degres dans le graphe partiel (0 pour un sommet retire).
+        nbVivants : nombre de sommets du graphe partiel.
+        nbAretes : nombre d'aretes du graphe partiel.
+        nbParDegre : nbParDegre[d] est le nombre de sommets du graphe partiel
+            de degre d.
+        degreMaximum : degre maximum du graphe partiel.
+        retires : trace des sommets retires, c'est-a-dire la couverture 
+            partielle.
+        couplageMaximum : None ou objet CouplageIncremental mis a jour a 
+            chaque retrait ou remise de sommet.
+        masque : None ou entier dont le bit v vaut 1 si le sommet v a ete 
+            retire, mis a jour a chaque retrait ou remise de sommet (voir 
+            suivreMasque).
+    """
+    
+    def __init__(self, graphe):
+        """
+        Cree l'etat initial, egal au graphe entier.
+        Args :
+            graphe : objet du type Graphe.
+        """
+        self.graphe = graphe
+        indptr = graphe.indptr.tolist()
+        indices = graphe.indices.tolist()
+        self.voisins = [indices[indptr[i]:indptr[i + 1]] for i in range(graphe.nbSommets)]
+        self.vivant = [True] * graphe.nbSommets
+        self.degres = graphe.degres.tolist()
+        self.nbVivants = graphe.nbSommets
+        self.nbAretes = graphe.nbAretes
+        self.degreMaximum = max(self.degres, default = 0)
+        self.nbParDegre = [0] * (self.degreMaximum + 1)
+        for d in self.degres:
+            self.nbParDegre[d] += 1
+        self.retires = []
+        self.couplageMaximum = None
+        self.masque = None
+        
+    def retirer(self, v):
+        """
+        Retire le sommet v (et ses aretes) du graphe partiel.
+        """
+        vivant = self.vivant
+        degres = self.degres
+        nbParDegre = self.nbParDegre
+        vivant[v] = False
+        for w in self.voisins[v]:
+            if vivant[w]:
+                nbParDegre[degres[w]] -= 1
+                degres[w] -= 1
+                nbParDegre[degres[w]] += 1
+        nbParDegre[degres[v]] -= 1
+        self.nbAretes -= degres[v]
+        self.nbVivants -= 1
+        degres[v] = 0
+        #le degre maximum ne peut que diminuer
+        while self.degreMaximum > 0 and nbParDegre[self.degreMaximum] == 0:
+            self.degreMaximum -= 1
+        self.retires.append(v)
+        if self.masque is not None:
+            self.masque |= 1 << v
+        if self.couplageMaximum is not None:
+            self.couplageMaximum.retirer(v)
+    
+    def restaurer(self, marque):
+        """
+        Remet dans le graphe partiel, dans l'ordre inverse, les sommets retires
+        apres que la trace avait la longueur marque.
+        """
+        vivant = self.vivant
+        degres = self.degres
+        nbParDegre = self.nbParDegre
+        while len(self.retires) > marque:
+            v = self.retires.pop()
+            d = 0
+            degreMaximum = self.degreMaximum
+            for w in self.voisins[v]:
+                if vivant[w]:
+                    nbParDegre[degres[w]] -= 1
+                    degres[w] += 1
+                    nbParDegre[degres[w]] += 1
+                    if degres[w] > degreMaximum:
+                        degreMaximum = degres[w]
+                    d += 1
+            vivant[v] = True
+            degres[v] = d
+            nbParDegre[d] += 1
+            self.degreMaximum = max(degreMaximum, d)
+            self.nbAretes += d
+            self.nbVivants += 1
+            if self.masque is not None:
+                self.masque ^= 1 << v
+            if self.couplageMaximum is not None:
+                self.couplageMaximum.remettre(v)
     
+    def suivreMasque(self):
+        """
+        Commence a maintenir masque, l'ensemble des sommets retires sous forme
+        d'un entier utilise comme bitset. Deux noeuds de l'arbre ont le meme
+        graphe partiel si et seulement s'ils ont le meme masque.
+        """
+        self.masque = 0
+        for v in self.retires:
+            self.masque |= 1 << v
+    
+    def reduire(self, candidats):
+        """
+        Applique en place, a partir des sommets candidats, les regles de 
+        reduction qui ne modifient pas le graphe autrement qu'en retirant des
+        sommets (voir le module reduction) : le voisin d'un sommet de degre 1
+        et les deux voisins adjacents d'un sommet de degre 2 sont retires, 
+        c'est-a-dire mis dans la couverture partielle. Les sommets retires sont
+        empiles dans la trace comme les autres.
+        Args :
+            candidats : sommets dont le degre a pu changer.
+        """
+        vivant = self.vivant
+        degres = self.degres
+        file = list(candidats)
+        while file:
+            v = file.pop()
+            if not vivant[v] or degres[v] == 0 or degres[v] > 2:
+                continue
+            voisins = self.voisinsVivants(v)
+            if degres[v] == 2 and voisins[1] not in self.voisins[voisins[0]]:
+                continue
+            for u in voisins:
+                file.extend(self.voisinsVivants(u))
+                self.retirer(u)
+    
+    def composantes(self):
+        """
+        Retourne les composantes connexes du graphe partiel qui ont au moins
+        une arete, sous forme de listes d'indices.
+        """
+        vivant = self.vivant
+        degres = self.degres
+        vu = [False] * len(vivant)
+        composantes = []
+        for s in range(len(vivant)):
+            if not degres[s] or vu[s]:
+                continue
+            vu[s] = True
+            composante = [s]
+            for u in composante:
+                for w in self.voisins[u]:
+                    if vivant[w] and not vu[w]:
+                        vu[w] = True
+                        composante.append(w)
+            composantes.append(composante)
+        return composantes
+    
+    def premierSommet(self, debut = 0):
+        """
+        Retourne le premier sommet (dans l'ordre des indices) de degre non nul,
+        c'est-a-dire la premiere extremite de la premiere arete du graphe 
+        partiel. Tous les sommets avant debut doivent etre de degre nul.
+        """
+        degres = self.degres
+        for i in range(debut, len(degres)):
+            if degres[i]:
+                return i
+        return None
+    
+    def premierVoisin(self, u):
+        """
+        Retourne le premier voisin present de u dans l'ordre d'adjacence.
+        """
+        for w in self.voisins[u]:
+            if self.vivant[w]:
+                return w
+        return None
+    
+    def sommetDegreMax(self):
+        """
+        Retourne le premier sommet de degre maximum du graphe partiel.
+        """
+        return self.degres.index(self.degreMaximum)
+    
+    def voisinsVivants(self, u):
+        """
+        Retourne la liste des voisins de u presents dans le graphe partiel.
+        """
+        vivant = self.vivant
+        return [w for w in self.voisins[u] if vivant[w]]
+    
+    def sommetsVivants(self):
+        """
+        Retourne la liste des noms des sommets du graphe partiel.
+        """
+        etiquettes = self.graphe.etiquettes.tolist()
+        return [etiquettes[i] for i, b in enumerate(self.vivant) if b]
+    
+    def aretesVivantes(self):
+        """
+        Retourne la liste des aretes (noms des sommets) du graphe partiel, 
+        dans le meme ordre que networkx.Graph.edges.
+        """
+        etiquettes = self.graphe.etiquettes.tolist()
+        vivant = self.vivant
+        return [(etiquettes[u], etiquettes[v]) for u in range(len(vivant)) if vivant[u]
+                for v in self.voisins[u] if v > u and vivant[v]]
+    
+    def couplage(self):
+        """
+        Retourne la liste des sommets couverts par le couplage maximal obtenu
+        en parcourant les aretes du graphe partiel dans l'ordre, comme 
+        Graphe.algoCouplage.
+        """
+        vivant = self.vivant
+        degres = self.degres
+        dansCouplage = [False] * len(vivant)
+        couverture = []
+        for u in range(len(vivant)):
+            if not degres[u] or dansCouplage[u]:
+                continue
+            for v in self.voisins[u]:
+                if v > u and vivant[v] and not dansCouplage[v]:
+                    dansCouplage[u] = dansCouplage[v] = True
+                    couverture.append(u)
+                    couverture.append(v)
+                    break
+        return couverture
+    
+    def tailleGlouton(self):
+        """
+        Retourne la taille de la couverture obtenue par l'algorithme glouton
+        (comme Graphe.algoGloutonSansCopies) sur le graphe partiel.
+        """
+        vivant = list(self.vivant)
+        degres = list(self.degres)
+        m = self.nbAretes
+        taille = 0
+        while m != 0:
+            v = degres.index(max(degres))
+            for w in self.voisins[v]:
+                if vivant[w]:
+                    degres[w] -= 1
+            m -= degres[v]
+            degres[v] = 0
+            vivant[v] = False
+            taille += 1
+        return taille
+    
+    
+_IDENTIFIANT_BINAIRE = b"COMPLEXG"
+_VERSION_BINAIRE = 1
+_FORMAT_ENTETE = "<8sIIqq"
+
+def _sectionsBinaires(n, m, largeur):
+    """
+    Retourne la liste des sections du format binaire de Graphe sous la forme
+    (nom du tableau, position en octets, forme), dans l'ordre du fichier.
+    """
+    sections = []
+    debut = 64
+    for tableau, forme, taille in [("etiquettes", (n,), 8), ("indptr", (n + 1,), 8), 
+                                   ("degres", (n,), largeur), ("indices", (2 * m,), largeur),
+                                   ("aretes", (m, 2), largeur)]:
+        sections.append((tableau, debut, forme))
+        debut += -(-int(np.prod(forme)) * taille // 64) * 64
+    return sections
+
+def convertirEnBinaire(nomTexte, nomBinaire, tailleBloc = 1 << 24):
+    """
+    Convertit un fichier d'instance au format texte donné à l'enoncé en un 
+    fichier au format binaire de Graphe (voir Graphe.sauvegarderBinaire).
+    Args :
+        nomTexte : nom du fichier texte a lire.
+        nomBinaire : nom du fichier binaire a ecrire.
+        tailleBloc (facultatif) : nombre d'octets lus a chaque etape.
+    Returns :
+        le graphe lu, dont les tableaux sont projetes depuis nomBinaire.
+    """
+    g = Graphe()
+    g._readFile(nomTexte, tailleBloc)
+    g.sauvegarderBinaire(nomBinaire)
+    return Graphe(nomBinaire = nomBinaire)
+
+class LecteurInstance:
+    """
+    Classe pour lire un fichier d'instance (format donné à l'enoncé) par blocs
+    de lignes. Chaque bloc est converti en entiers d'un seul coup avec numpy,
+    et seul un bloc est garde en memoire a la fois.
+    S'utilise avec with :
+        with LecteurInstance("exempleinstance.txt") as lecteur:
+            for bloc in lecteur.blocsSommets(): ...
+            for bloc in lecteur.blocsAretes(): ...
+    
+    Attributs :
+        nomFichier : nom du fichier lu.
+        tailleBloc : nombre d'octets lus a chaque etape (None pour lire tout
+            le fichier en une fois).
+        nbSommets : nombre de sommets annonce dans l'entete.
+        nbAretes : nombre d'aretes annonce dans l'entete (None tant que la 
+            section des aretes n'a pas ete atteinte).
+    """
+    
+    def __init__(self, nomFichier, tailleBloc = 1 << 24):
+        self.nomFichier = nomFichier
+        self.tailleBloc = tailleBloc
+        self.nbSommets = None
+        self.nbAretes = None
+        
+    def __enter__(self):
+        self._fichier = open(self.nomFichier, "rb")
+        self._tampon = b""
+        self._ligne = 0
+        self._sommetsLus = False
+        self._verifierTitre("Nombre de sommets")
+        self.nbSommets = self._lireEntier()
+        self._verifierTitre("Sommets")
+        return self
+    
+    def __exit__(self, *args):
+        self._fichier.close()
+        
+    def _erreur(self, message, ligne = None):
+        """
+        Retourne une exception ValueError indiquant le fichier et la ligne.
+        """
+        ligne = self._ligne if ligne is None else ligne
+        return ValueError("{}, ligne {} : {}".format(self.nomFichier, ligne, message))
+        
+    def _lire(self):
+        """
+        Lit un nouveau bloc du fichier et le rajoute au tampon. Retourne False
+        a la fin du fichier.
+        """
+        donnees = self._fichier.read(-1 if self.tailleBloc is None else self.tailleBloc)
+        if not donnees:
+            return False
+        self._tampon += donnees
+        return True
+    
+    def _lireLigne(self):
+        """
+        Retourne la ligne suivante du fichier, sans le saut de ligne.
+        """
+        while b"\n" not in self._tampon:
+            if not self._lire():
+                if not self._tampon:
+                    raise self._erreur("fin de fichier inattendue", self._ligne + 1)
+                self._tampon += b"\n"
+        ligne, self._tampon = self._tampon.split(b"\n", 1)
+        self._ligne += 1
+        return ligne.decode("utf-8", "replace").rstrip("\r")
+    
+    def _verifierTitre(self, titre):
+        ligne = self._lireLigne()
+        if ligne != titre:
+            raise self._erreur("entete '{}' attendu, '{}' lu".format(titre, ligne))
+        
+    def _lireEntier(self):
+        ligne = self._lireLigne()
+        try:
+            valeur = int(ligne)
+        except ValueError:
+            raise self._erreur("entier attendu, '{}' lu".format(ligne)) from None
+        if valeur < 0:
+            raise self._erreur("nombre negatif {}".format(valeur))
+        return valeur
+    
+    def _blocsLignes(self, nbLignes):
+        """
+        Generateur des blocs de lignes completes, sous forme de tableaux numpy
+        d'octets, jusqu'a avoir lu exactement nbLignes lignes. Renvoie aussi le
+        numero de la premiere ligne de chaque bloc.
+        """
+        restant = nbLignes
+        while restant > 0:
+            if b"\n" not in self._tampon and not self._lire():
+                if not self._tampon:
+                    raise self._erreur("fin de fichier inattendue, {} lignes manquantes"
+                                       .format(restant), self._ligne + 1)
+                self._tampon += b"\n"
+            fin = self._tampon.rfind(b"\n")
+            if fin == -1:
+                continue
+            octets = np.frombuffer(self._tampon, dtype = np.uint8, count = fin + 1)
+            sauts = np.flatnonzero(octets == 10)
+            if sauts.size > restant:
+                fin = sauts[restant - 1]
+                sauts = sauts[:restant]
+            bloc = np.frombuffer(self._tampon[:fin + 1], dtype = np.uint8)
+            self._tampon = self._tampon[fin + 1:]
+            yield bloc, self._ligne + 1
+            self._ligne += sauts.size
+            restant -= sauts.size
+    
+    def blocsSommets(self):
+        """
+        Generateur des noms des sommets, par tableaux numpy d'entiers.
+        """
+        if self._sommetsLus:
+            return
+        self._sommetsLus = True
+        for bloc, premiere in self._blocsLignes(self.nbSommets):
+            yield self._parserEntiers(bloc, 1, premiere)[:, 0]
+    
+    def blocsAretes(self):
+        """
+        Generateur des aretes, par tableaux numpy d'entiers de taille k x 2. 
+        Si les sommets n'ont pas encore ete lus, ils sont sautes.
+        """
+        for _ in self.blocsSommets():
+            pass
+        if self.nbAretes is None:
+            self._verifierTitre("Nombre d aretes")
+            self.nbAretes = self._lireEntier()
+            self._verifierTitre("Aretes")
+            for bloc, premiere in self._blocsLignes(self.nbAretes):
+                yield self._parserEntiers(bloc, 2, premiere)
+    
+    def _parserEntiers(self, octets, parLigne, premiere):
+        """
+        Convertit un bloc de lignes completes en entiers, de façon vectorisee.
+        Args :
+            octets : tableau numpy d'octets terminant par un saut de ligne.
+            parLigne : nombre d'entiers attendus sur chaque ligne.
+            premiere : numero de la premiere ligne du bloc (pour les erreurs).
+        Returns :
+            un tableau numpy d'entiers de taille (nombre de lignes) x parLigne.
+        """
+        chiffre = (octets >= 48) & (octets <= 57)
+        signe = octets == 45
+        jeton = chiffre | signe
+        numLigne = np.cumsum(octets == 10) - (octets == 10)
+        valide = jeton | (octets == 32) | (octets == 9) | (octets == 13) | (octets == 10)
+        if not valide.all():
+            i = np.argmin(valide)
+            raise self._erreur("caractere invalide {!r}".format(chr(octets[i])), 
+                               premiere + numLigne[i])
+        precedent = np.concatenate(([False], jeton[:-1]))
+        suivant = np.concatenate((jeton[1:], [False]))
+        debuts = np.flatnonzero(jeton & ~precedent)
+        fins = np.flatnonzero(jeton & ~suivant) + 1
+        #on verifie le nombre d'entiers par ligne
+        nbLignes = int(numLigne[-1]) + 1
+        parLignes = np.bincount(numLigne[debuts], minlength = nbLignes)
+        if np.any(parLignes != parLigne):
+            i = np.flatnonzero(parLignes != parLigne)[0]
+            raise self._erreur("{} entier(s) attendu(s), {} lu(s)".format(parLigne, parLignes[i]),
+                               premiere + i)
+        #le signe ne peut etre qu'en debut d'entier et suivi d'au moins un chiffre
+        longueurs = fins - debuts - signe[debuts]
+        malFormes = (signe & precedent).any() or np.any(longueurs == 0) or np.any(longueurs > 18)
+        if malFormes:
+            mauvais = np.flatnonzero((longueurs == 0) | (longueurs > 18))
+            i = numLigne[debuts[mauvais[0]]] if mauvais.size else numLigne[np.argmax(signe & precedent)]
+            raise self._erreur("entier mal forme", premiere + i)
+        #valeur de chaque chiffre selon sa position dans l'entier
+        positions = np.flatnonzero(chiffre)
+        numJeton = np.cumsum(jeton & ~precedent)[positions] - 1
+        puissances = 10 ** np.arange(19, dtype = np.int64)
+        contributions = (octets[positions] - 48).astype(np.int64) * puissances[fins[numJeton] - 1 - positions]
+        valeurs = np.add.reduceat(contributions, np.searchsorted(positions, debuts))
+        valeurs[signe[debuts]] *= -1
+        return valeurs.reshape(-1, parLigne)
+    
+    
+def _gloutonSeaux(voisins, vivant, degres):
+    """
+    Algorithme glouton en O(n + m) a l'aide d'une file de priorite a seaux :
+    seaux[d] est une liste doublement chainee (tableaux suivant et precedent)
+    des sommets de degre d. Les listes en argument ne sont pas modifiees.
+    Args :
+        voisins : listes d'adjacence (indices internes).
+        vivant : liste de booleens, True si le sommet est present.
+        degres : liste des degres (0 pour les sommets absents).
+    Returns :
+        la liste des indices des sommets choisis, dans l'ordre de selection.
+    """
+    n = len(degres)
+    degres = list(degres)
+    vivant = list(vivant)
+    degreMax = max(degres, default = 0)
+    seaux = [-1] * (degreMax + 1)
+    suivant = [-1] * n
+    precedent = [-1] * n
+    #on insere en tete, du dernier au premier sommet, pour que le premier 
+    #sommet soit en tete de son seau
+    for v in range(n - 1, -1, -1):
+        d = degres[v]
+        if d > 0:
+            suivant[v] = seaux[d]
+            if seaux[d] != -1:
+                precedent[seaux[d]] = v
+            seaux[d] = v
+    couverture = []
+    while degreMax > 0:
+        v = seaux[degreMax]
+        if v == -1:
+            degreMax -= 1
+            continue
+        #on retire v de son seau et du graphe
+        seaux[degreMax] = suivant[v]
+        if suivant[v] != -1:
+            precedent[suivant[v]] = -1
+        vivant[v] = False
+        couverture.append(v)
+        for w in voisins[v]:
+            if not vivant[w]:
+                continue
+            #on deplace w du seau d au seau d - 1
+            d = degres[w]
+            if precedent[w] != -1:
+                suivant[precedent[w]] = suivant[w]
+            else:
+                seaux[d] = suivant[w]
+            if suivant[w] != -1:
+                precedent[suivant[w]] = precedent[w]
+            d -= 1
+            degres[w] = d
+            precedent[w] = -1
+            if d > 0:
+                suivant[w] = seaux[d]
+                if seaux[d] != -1:
+                    precedent[seaux[d]] = w
+                seaux[d] = w
+            else:
+                suivant[w] = -1
+    return couverture
+
+
+def degresAretes(aretes, nbSommets):
+    """
+    Retourne les degres des sommets d'un graphe donne par ses aretes.
+    Args :
+        aretes : tableau numpy d'entiers de taille m x 2 (indices des 
+            extremites).
+        nbSommets : nombre de sommets.
+    Returns :
+        un tableau numpy de taille nbSommets.
+    """
+    return np.bincount(np.asarray(aretes).ravel(), minlength = nbSommets)
+
+def couplageAretes(aretes, nbSommets, tailleBloc = 1 << 22):
+    """
+    Calcule le couplage maximal obtenu en parcourant les aretes dans l'ordre
+    (celui de Graphe.algoCouplage) par des operations vectorisees. Les aretes
+    sont traitees par blocs de tailleBloc ; dans un bloc, on procede par 
+    tours : toutes les aretes restantes qui sont la premiere arete restante 
+    en chacune de leurs extremites sont prises (l'algorithme sequentiel les 
+    prend aussi), puis les aretes qui touchent un sommet couvert sont 
+    ecartees. Si un tour decide trop peu d'aretes (par exemple sur une 
+    chaine dont les aretes sont dans l'ordre), le reste du bloc est parcouru
+    sequentiellement.
+    Args :
+        aretes : tableau numpy d'entiers de taille m x 2 (indices des 
+            extremites).
+        nbSommets : nombre de sommets.
+        tailleBloc (facultatif) : nombre d'aretes traitees a la fois.
+    Returns :
+        un tableau numpy de booleens de taille nbSommets, True pour les 
+        sommets couverts par le couplage.
+    """
+    aretes = np.asarray(aretes)
+    couvert = np.zeros(nbSommets, dtype = bool)
+    premiere = np.empty(nbSommets, dtype = np.int64)
+    for debut in range(0, aretes.shape[0], tailleBloc):
+        _couplageBloc(aretes[debut:debut + tailleBloc, 0], aretes[debut:debut + tailleBloc, 1],
+                      couvert, premiere)
+    return couvert
+
+def _couplageBloc(u, v, couvert, premiere):
+    """
+    Prolonge le couplage glouton avec les aretes (u[i], v[i]) prises dans 
+    l'ordre (voir couplageAretes).
+    Args :
+        u, v : tableaux numpy des indices des extremites des aretes.
+        couvert : tableau numpy de booleens des sommets deja couverts, 
+            modifie en place.
+        premiere : tableau numpy d'entiers de meme taille que couvert, 
+            utilise comme espace de travail.
+    """
+    sentinelle = u.size
+    garder = ~(couvert[u] | couvert[v])
+    restantes = np.flatnonzero(garder)
+    u, v = u[garder], v[garder]
+    while restantes.size:
+        #premiere arete restante en chaque sommet
+        premiere[u] = sentinelle
+        premiere[v] = sentinelle
+        np.minimum.at(premiere, u, restantes)
+        np.minimum.at(premiere, v, restantes)
+        prises = (premiere[u] == restantes) & (premiere[v] == restantes)
+        couvert[u[prises]] = True
+        couvert[v[prises]] = True
+        #on ecarte les aretes prises et celles qui touchent un sommet couvert
+        garder = ~(couvert[u] | couvert[v])
+        nbRestantes = restantes.size
+        restantes, u, v = restantes[garder], u[garder], v[garder]
+        if 32 * (nbRestantes - restantes.size) < nbRestantes:
+            #trop peu de progres : parcours sequentiel du reste du bloc
+            for i, j in zip(u.tolist(), v.tolist()):
+                if not couvert[i] and not couvert[j]:
+                    couvert[i] = couvert[j] = True
+            break
+
+def _blocsFlux(source, tailleBloc, tailleOctets):
+    """
+    Generateur des blocs d'aretes (tableaux numpy d'entiers de taille k x 2)
+    d'un fichier d'instance ou d'un iterable, voir couplageFlux.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with LecteurInstance(source, tailleOctets) as lecteur:
+            yield from lecteur.blocsAretes()
+        return
+    tampon = []
+    for element in source:
+        if isinstance(element, np.ndarray) and element.ndim == 2:
+            if tampon:
+                yield np.array(tampon, dtype = np.int64)
+                tampon = []
+            yield element
+        else:
+            tampon.append(element)
+            if len(tampon) == tailleBloc:
+                yield np.array(tampon, dtype = np.int64)
+                tampon = []
+    if tampon:
+        yield np.array(tampon, dtype = np.int64)
+
+def couplageFlux(source, tailleBloc = 1 << 20, tailleOctets = 1 << 20):
+    """
+    Calcule en une seule passe la couverture de l'algorithme de couplage 
+    (aretes prises dans l'ordre du flux) sans construire le graphe : les 
+    aretes sont lues par blocs et seul un tableau de booleens des sommets 
+    couverts, indexe par nom (decale du plus petit nom rencontre) et agrandi
+    au besoin, est garde d'un bloc a l'autre. Chaque bloc coute donc un 
+    temps proportionnel a sa taille et la memoire utilisee est en 
+    O(ecart entre les noms extremes + tailleBloc), independante du nombre 
+    d'aretes.
+    Args :
+        source : nom d'un fichier d'instance (format donné à l'enoncé, lu par
+            LecteurInstance) ou iterable d'aretes (couples de noms entiers) ou
+            de tableaux numpy d'entiers de taille k x 2.
+        tailleBloc (facultatif) : nombre d'aretes regroupees en un bloc quand
+            source est un iterable de couples.
+        tailleOctets (facultatif) : nombre d'octets lus a chaque etape quand
+            source est un fichier. La conversion d'un bloc utilise environ 
+            60 octets de memoire par octet lu.
+    Returns :
+        un ensemble de sommets qui forment une couverture du graphe.
+    """
+    couvert = np.zeros(0, dtype = bool)
+    premiere = np.empty(0, dtype = np.int64)
+    base = 0
+    for bloc in _blocsFlux(source, tailleBloc, tailleOctets):
+        if bloc.size == 0:
+            continue
+        bloc = bloc.astype(np.int64, copy = False)
+        mini, maxi = int(bloc.min()), int(bloc.max())
+        if couvert.size == 0:
+            base = mini
+        if mini < base or maxi - base >= couvert.size:
+            #agrandissement (au moins par doublement) du tableau des couverts
+            nouvelleBase = min(base, mini)
+            taille = max(maxi, base + couvert.size - 1) - nouvelleBase + 1
+            taille = max(taille, 2 * couvert.size)
+            agrandi = np.zeros(taille, dtype = bool)
+            agrandi[base - nouvelleBase:base - nouvelleBase + couvert.size] = couvert
+            couvert, base = agrandi, nouvelleBase
+            premiere = np.empty(taille, dtype = np.int64)
+        _couplageBloc(bloc[:, 0] - base, bloc[:, 1] - base, couvert, premiere)
+    return set((np.flatnonzero(couvert) + base).tolist())
+
+def _voisinages(indptr, indices, sommets):
+    """
+    Retourne les degres de sommets et la concatenation de leurs listes 
+    d'adjacence (tableaux numpy).
+    """
+    longueurs = indptr[sommets + 1] - indptr[sommets]
+    positions = (np.repeat(indptr[sommets] - np.cumsum(longueurs) + longueurs, longueurs)
+                 + np.arange(longueurs.sum()))
+    return longueurs, indices[positions].astype(np.int64)
+
+def _independantLexicographique(k, u, v):
+    """
+    Calcule l'ensemble independant maximal obtenu en parcourant les sommets 0
+    a k - 1 dans l'ordre et en prenant chaque sommet qui n'a pas de voisin 
+    deja pris. On procede par tours : un sommet non decide dont tous les 
+    voisins plus petits sont ecartes est pris, puis ses voisins sont ecartes.
+    Si un tour decide trop peu de sommets, le reste est parcouru 
+    sequentiellement.
+    Args :
+        k : nombre de sommets.
+        u, v : tableaux numpy des extremites des aretes, chaque arete etant
+            donnee dans les deux sens.
+    Returns :
+        un tableau numpy de booleens de taille k.
+    """
+    pris = np.zeros(k, dtype = bool)
+    indecis = np.ones(k, dtype = bool)
+    rang = np.arange(k)
+    minVoisin = np.empty(k, dtype = np.int64)
+    while u.size:
+        minVoisin[:] = k
+        np.minimum.at(minVoisin, u, v)
+        choisis = indecis & (minVoisin > rang)
+        pris |= choisis
+        indecis &= ~choisis
+        indecis[v[choisis[u]]] = False
+        garder = indecis[u] & indecis[v]
+        nbAretes = u.size
+        u, v = u[garder], v[garder]
+        if 32 * (nbAretes - u.size) < nbAretes:
+            #trop peu de progres : parcours sequentiel des sommets restants
+            ordre = np.argsort(u, kind = "stable")
+            debuts = np.searchsorted(u[ordre], rang).tolist() + [u.size]
+            voisins = v[ordre].tolist()
+            indecis = indecis.tolist()
+            for x in np.flatnonzero(indecis).tolist():
+                if indecis[x]:
+                    pris[x] = True
+                    for y in voisins[debuts[x]:debuts[x + 1]]:
+                        indecis[y] = False
+            return pris
+    return pris | indecis
+
+def gloutonNiveaux(indptr, indices, degres):
+    """
+    Calcule la couverture de Graphe.algoGloutonSansCopies (on retire a chaque
+    etape le premier sommet de degre maximum) par niveaux de degre. Tant que
+    le degre maximum vaut D, le sommet retire est le premier sommet de degre 
+    D qui n'est voisin d'aucun sommet deja retire a ce niveau : les sommets 
+    retires au niveau D forment l'ensemble independant lexicographique des 
+    sommets de degre D (voir _independantLexicographique), et tous les 
+    autres sommets ont ensuite un degre plus petit que D. Chaque niveau est 
+    traite par des operations numpy sur les sommets de degre non nul, en 
+    O(n + m) par niveau au pire.
+    Args :
+        indptr, indices, degres : tableaux CSR du graphe (voir Graphe).
+    Returns :
+        un tableau numpy de booleens de taille n, True pour les sommets de la
+        couverture.
+    """
+    degres = np.array(degres, dtype = np.int64)
+    dans = np.zeros(degres.size, dtype = bool)
+    local = np.empty(degres.size, dtype = np.int64)
+    actifs = np.flatnonzero(degres)
+    while actifs.size:
+        degresActifs = degres[actifs]
+        degreMax = degresActifs.max()
+        niveau = actifs[degresActifs == degreMax]
+        #aretes entre sommets du niveau, en indices locaux au niveau
+        longueurs, v = _voisinages(indptr, indices, niveau)
+        u = np.repeat(np.arange(niveau.size), longueurs)
+        garder = degres[v] == degreMax
+        local[niveau] = np.arange(niveau.size)
+        pris = niveau[_independantLexicographique(niveau.size, u[garder], local[v[garder]])]
+        dans[pris] = True
+        #mise a jour des degres des voisins encore presents
+        _, voisins = _voisinages(indptr, indices, pris)
+        np.subtract.at(degres, voisins[degres[voisins] > 0], 1)
+        degres[pris] = 0
+        actifs = actifs[degres[actifs] > 0]
+    return dans
+
+if hasattr(int, "bit_count"):
+    _nbBits = int.bit_count
+else:
+    def _nbBits(x):
+        """
+        Retourne le nombre de bits a 1 de l'entier positif x.
+        """
+        return bin(x).count("1")
+
+def _branchementBits(voisins, sommetMax = False, elimDegre1 = False, couvInitiale = None):
+    """
+    Branchement de algoBranchementAmeliore (borne maximale par le couplage, 
+    borne minimale par b1, b2, b3) sur des bitsets : le bit v de adj[u] vaut 
+    1 si (u, v) est une arete. Un noeud de l'arbre est represente par deux 
+    entiers : les sommets non isoles du graphe partiel et la couverture 
+    partielle.
+    Args :
+        voisins : listes d'adjacence (indices internes).
+        sommetMax, elimDegre1 (facultatifs) : voir 
+            Graphe.algoBranchementAmeliore.
+        couvInitiale (facultatif) : liste des indices d'une couverture de 
+            depart.
+    Returns :
+        un tuple forme par la liste des indices des sommets d'une couverture 
+        minimale et le nombre des noeuds de l'arbre parcourus.
+    """
+    n = len(voisins)
+    adj = [0] * n
+    racine = 0
+    for u in range(n):
+        for v in voisins[u]:
+            adj[u] |= 1 << v
+        if adj[u]:
+            racine |= 1 << u
+    couvMin = (1 << n) - 1
+    tailleMin = n
+    if couvInitiale is not None:
+        couvMin = sum(1 << v for v in couvInitiale)
+        tailleMin = len(couvInitiale)
+    borneMax = tailleMin
+    cpt = 0
+    pile = [(racine, 0, 0)]
+    while pile:
+        vivants, couverture, taillePart = pile.pop()
+        cpt += 1
+        #degres des sommets du graphe partiel, les sommets devenus isoles 
+        #sont retires de vivants
+        premier = -1
+        u = -1
+        degreMax = 0
+        sommeDegres = 0
+        reste = vivants
+        while reste:
+            b = reste & -reste
+            reste ^= b
+            v = b.bit_length() - 1
+            d = _nbBits(adj[v] & vivants)
+            if d == 0:
+                vivants ^= b
+                continue
+            if premier == -1:
+                premier = v
+            if d > degreMax:
+                degreMax = d
+                u = v
+            sommeDegres += d
+        #cas de base : plus d'aretes
+        if sommeDegres == 0:
+            if taillePart < tailleMin:
+                couvMin = couverture
+                tailleMin = taillePart
+            borneMax = min(borneMax, tailleMin)
+            continue
+        #couplage maximal en parcourant les sommets dans l'ordre
+        libres = vivants
+        tailleCouplage = 0
+        reste = vivants
+        while reste:
+            b = reste & -reste
+            reste ^= b
+            if libres & b:
+                candidats = adj[b.bit_length() - 1] & libres
+                if candidats:
+                    w = candidats & -candidats
+                    libres ^= b | w
+                    reste &= ~w
+                    tailleCouplage += 1
+        borneMax = min(borneMax, taillePart + 2 * tailleCouplage)
+        nbVivants = _nbBits(vivants)
+        m = sommeDegres // 2
+        b1 = math.ceil(m / degreMax)
+        b3 = (2 * nbVivants - 1 - math.sqrt((2 * nbVivants - 1)**2 - 8 * m)) / 2
+        if taillePart + max(b1, tailleCouplage, b3) > borneMax:
+            continue
+        if not sommetMax:
+            u = premier
+        #on ajoute les voisins de u, puis u lui-meme
+        nu = adj[u] & vivants
+        pile.append((vivants & ~nu, couverture | nu, taillePart + _nbBits(nu)))
+        if not (elimDegre1 and _nbBits(nu) == 1):
+            b = 1 << u
+            pile.append((vivants ^ b, couverture | b, taillePart + 1))
+    return [v for v in range(n) if couvMin >> v & 1], cpt
+
 
 if __name__ == "__main__":
     
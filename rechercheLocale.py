@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Recherche locale pour ameliorer une couverture, pour le projet de COMPLEX
+2019-2020.
+
+L'algorithme suit NuMVC (Cai et al., 2013) et FastVC (Cai, 2015) :
+    - chaque arete a un poids, augmente de 1 a chaque pas ou elle n'est pas
+      couverte, et les poids sont reduits (oubli) quand leur moyenne depasse
+      un seuil ;
+    - le score d'un sommet est la variation du poids des aretes non couvertes
+      quand on le rajoute a (score positif) ou retire de (score negatif) la
+      couverture courante. Il est mis a jour en O(degre) a chaque mouvement ;
+    - quand la couverture courante couvre toutes les aretes, elle est gardee
+      et on en retire un sommet. Sinon, on echange deux sommets : on retire de
+      la couverture le meilleur sommet d'un echantillon (choix BMS de FastVC),
+      puis on rajoute une extremite d'une arete non couverte tiree au hasard,
+      en respectant la verification de configuration (un sommet retire ne
+      peut etre rajoute que si un de ses voisins a change d'etat depuis).
+"""
+
+import random
+import time
+
+import numpy as np
+
+class RechercheLocale:
+    """
+    Classe pour ameliorer une couverture d'un objet Graphe par recherche
+    locale.
+
+    Attributs :
+        n, m : nombres de sommets et d'aretes.
+        extremites : liste des couples (u, v) d'indices des extremites des
+            aretes.
+        incidentes : liste, pour chaque sommet, des couples (voisin, arete).
+        dans : liste de booleens, True pour les sommets de la couverture
+            courante.
+        couverture, position : liste des sommets de la couverture courante et
+            position de chaque sommet dans cette liste (-1 s'il n'y est pas).
+        nonCouvertes, positionArete : liste des aretes non couvertes et
+            position de chaque arete dans cette liste (-1 si elle est couverte).
+        poids : liste des poids des aretes, poidsTotal leur somme.
+        score : liste des scores des sommets.
+        configuration : liste de booleens, False pour les sommets qui ne
+            peuvent pas etre rajoutes (verification de configuration).
+        age : liste avec, pour chaque sommet, le numero du dernier pas ou il a
+            change d'etat (les plus anciens sont preferes en cas d'egalite).
+        meilleure : liste des sommets de la plus petite couverture trouvee.
+        pas : nombre de pas effectues.
+    """
+
+    def __init__(self, graphe, couverture, graine = None, echantillon = 50,
+                 seuilOubli = None, facteurOubli = 0.3):
+        """
+        Args :
+            graphe : objet du type Graphe.
+            couverture : ensemble de sommets (noms) de depart. S'il ne couvre
+                pas toutes les aretes, il est d'abord complete.
+            graine (facultatif) : graine (entier) ou objet
+                numpy.random.Generator. Si None, la graine est tiree du
+                generateur global de numpy.
+            echantillon (facultatif) : nombre de sommets de la couverture
+                tires pour choisir le sommet a retirer.
+            seuilOubli (facultatif) : poids moyen des aretes au-dela duquel
+                les poids sont reduits, par defaut n / 2 (comme NuMVC).
+            facteurOubli (facultatif) : facteur de reduction des poids.
+        """
+        if isinstance(graine, np.random.Generator):
+            graine = int(graine.integers(1 << 62))
+        elif graine is None:
+            graine = int(np.random.randint(1 << 31))
+        self.alea = random.Random(graine)
+        self.echantillon = echantillon
+        self.n = graphe.nbSommets
+        aretes = graphe.tableauAretes()
+        self.m = aretes.shape[0]
+        self.seuilOubli = self.n / 2 if seuilOubli is None else seuilOubli
+        self.facteurOubli = facteurOubli
+        self.extremites = [tuple(a) for a in aretes.tolist()]
+        self.incidentes = [[] for _ in range(self.n)]
+        for e, (u, v) in enumerate(self.extremites):
+            self.incidentes[u].append((v, e))
+            self.incidentes[v].append((u, e))
+
+        self.dans = [False] * self.n
+        for i in np.unique(np.asarray([graphe._indice(s) for s in couverture],
+                                      dtype = np.int64)).tolist():
+            self.dans[i] = True
+        #on complete la couverture avec les aretes non couvertes
+        for u, v in self.extremites:
+            if not self.dans[u] and not self.dans[v]:
+                self.dans[u] = True
+        self.couverture = [i for i in range(self.n) if self.dans[i]]
+        self.position = [-1] * self.n
+        for p, i in enumerate(self.couverture):
+            self.position[i] = p
+        self.nonCouvertes = []
+        self.positionArete = [-1] * self.m
+        self.poids = [1] * self.m
+        self.poidsTotal = self.m
+        self._calculerScores()
+        self.configuration = [True] * self.n
+        self.age = [0] * self.n
+        self.meilleure = list(self.couverture)
+        self.pas = 0
+        self.dernierRajoute = -1
+
+    def _calculerScores(self):
+        """
+        Calcule les scores de tous les sommets a partir des poids des aretes.
+        """
+        self.score = [0] * self.n
+        dans = self.dans
+        for e, (u, v) in enumerate(self.extremites):
+            if dans[u] != dans[v]:
+                #arete couverte par un seul sommet
+                self.score[u if dans[u] else v] -= self.poids[e]
+            elif not dans[u]:
+                self.score[u] += self.poids[e]
+                self.score[v] += self.poids[e]
+
+    def _retirer(self, u):
+        """
+        Retire le sommet u de la couverture courante.
+        """
+        dans, score, poids = self.dans, self.score, self.poids
+        dans[u] = False
+        score[u] = -score[u]
+        self.configuration[u] = False
+        self.age[u] = self.pas
+        #retrait de u de la liste de la couverture
+        p = self.position[u]
+        dernier = self.couverture.pop()
+        if dernier != u:
+            self.couverture[p] = dernier
+            self.position[dernier] = p
+        self.position[u] = -1
+        for w, e in self.incidentes[u]:
+            self.configuration[w] = True
+            if dans[w]:
+                score[w] -= poids[e]
+            else:
+                score[w] += poids[e]
+                self.positionArete[e] = len(self.nonCouvertes)
+                self.nonCouvertes.append(e)
+
+    def _rajouter(self, v):
+        """
+        Rajoute le sommet v a la couverture courante.
+        """
+        dans, score, poids = self.dans, self.score, self.poids
+        dans[v] = True
+        score[v] = -score[v]
+        self.age[v] = self.pas
+        self.position[v] = len(self.couverture)
+        self.couverture.append(v)
+        for w, e in self.incidentes[v]:
+            self.configuration[w] = True
+            if dans[w]:
+                score[w] += poids[e]
+            else:
+                score[w] -= poids[e]
+                #retrait de e de la liste des aretes non couvertes
+                p = self.positionArete[e]
+                derniere = self.nonCouvertes.pop()
+                if derniere != e:
+                    self.nonCouvertes[p] = derniere
+                    self.positionArete[derniere] = p
+                self.positionArete[e] = -1
+
+    def _meilleurRetrait(self, candidats):
+        """
+        Retourne le sommet de candidats de plus grand score (le plus ancien en
+        cas d'egalite), different du dernier sommet rajoute si possible.
+        """
+        score, age = self.score, self.age
+        meilleur = -1
+        for u in candidats:
+            if u == self.dernierRajoute:
+                continue
+            if (meilleur < 0 or score[u] > score[meilleur]
+                or (score[u] == score[meilleur] and age[u] < age[meilleur])):
+                meilleur = u
+        return self.dernierRajoute if meilleur < 0 else meilleur
+
+    def _augmenterPoids(self):
+        """
+        Augmente de 1 le poids des aretes non couvertes, et reduit tous les
+        poids si leur moyenne depasse le seuil d'oubli.
+        """
+        score, poids = self.score, self.poids
+        for e in self.nonCouvertes:
+            poids[e] += 1
+            u, v = self.extremites[e]
+            score[u] += 1
+            score[v] += 1
+        self.poidsTotal += len(self.nonCouvertes)
+        if self.poidsTotal >= self.seuilOubli * self.m:
+            self.poids = [int(p * self.facteurOubli) for p in poids]
+            self.poidsTotal = sum(self.poids)
+            self._calculerScores()
+
+    def executer(self, tempsMax = None, pasMax = None, verification = 64):
+        """
+        Effectue des pas de recherche locale jusqu'a ce que tempsMax secondes
+        ou pasMax pas se soient ecoules, ou qu'une couverture vide soit
+        trouvee.
+        Args :
+            tempsMax (facultatif) : temps maximum (en secondes, temps reel).
+            pasMax (facultatif) : nombre maximum de pas.
+            verification (facultatif) : nombre de pas entre deux
+                verifications du temps.
+        Returns :
+            la liste des indices des sommets de la meilleure couverture.
+        """
+        debut = time.perf_counter()
+        fin = None if pasMax is None else self.pas + pasMax
+        alea = self.alea
+        while self.couverture and self.pas != fin:
+            if (tempsMax is not None and self.pas % verification == 0
+                and time.perf_counter() - debut >= tempsMax):
+                break
+            self.pas += 1
+            if not self.nonCouvertes:
+                #couverture : on la garde et on en retire le meilleur sommet
+                self.meilleure = list(self.couverture)
+                self.dernierRajoute = -1
+                self._retirer(self._meilleurRetrait(self.couverture))
+                continue
+            #echange : retrait du meilleur sommet d'un echantillon...
+            if len(self.couverture) <= self.echantillon:
+                candidats = self.couverture
+            else:
+                candidats = [self.couverture[int(alea.random() * len(self.couverture))]
+                             for _ in range(self.echantillon)]
+            self._retirer(self._meilleurRetrait(candidats))
+            #... et rajout d'une extremite d'une arete non couverte
+            e = self.nonCouvertes[int(alea.random() * len(self.nonCouvertes))]
+            u, v = self.extremites[e]
+            if not self.configuration[u]:
+                u, v = v, u
+            if (self.configuration[v] and (self.score[v] > self.score[u]
+                or (self.score[v] == self.score[u] and self.age[v] < self.age[u]))):
+                u = v
+            self._rajouter(u)
+            self.dernierRajoute = u
+            self._augmenterPoids()
+        if not self.nonCouvertes and len(self.couverture) < len(self.meilleure):
+            self.meilleure = list(self.couverture)
+        return self.meilleure
+
+def ameliorer(graphe, couverture, tempsMax = 0.1, pasMax = None, graine = None):
+    """
+    Ameliore une couverture d'un graphe par recherche locale.
+    Args :
+        graphe : objet du type Graphe.
+        couverture : ensemble de sommets formant une couverture du graphe.
+        tempsMax (facultatif) : temps maximum (en secondes, temps reel), None
+            pour ne s'arreter qu'apres pasMax pas.
+        pasMax (facultatif) : nombre maximum de pas.
+        graine (facultatif) : graine (entier) ou objet numpy.random.Generator.
+    Returns :
+        un ensemble de sommets qui forment une couverture du graphe, de taille
+        au plus celle de couverture.
+    """
+    recherche = RechercheLocale(graphe, couverture, graine)
+    return graphe._noms(recherche.executer(tempsMax, pasMax))
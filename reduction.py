@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Regles de reduction (kernelization) pour le projet de COMPLEX 2019-2020.
+
+Les regles appliquees avant la recherche sont :
+    - suppression des sommets isoles ;
+    - degre 1 : le voisin d'un sommet de degre 1 est mis dans la couverture ;
+    - degre 2 : si les deux voisins u et w d'un sommet v sont adjacents, ils
+      sont mis dans la couverture. Sinon, v, u et w sont remplaces par un
+      nouveau sommet x voisin de N(u) et N(w) (pliage) : une couverture du
+      graphe plie donne une couverture du graphe d'origine avec un sommet de
+      plus (u et w si x est dans la couverture, v sinon) ;
+    - Buss, si on cherche une couverture de taille au plus k : un sommet de
+      degre plus grand que k est dans la couverture, et s'il reste plus de
+      k^2 aretes, il n'existe pas de couverture de taille k.
+"""
+
+from collections import deque
+
+class Relevement:
+    """
+    Classe pour reconstruire une couverture du graphe d'origine a partir
+    d'une couverture du graphe reduit.
+
+    Attributs :
+        operations : liste, dans l'ordre, des operations de reduction :
+            ("force", s) ou ("pli", x, v, u, w).
+        decalage : nombre de sommets rajoutes par le relevement, c'est-a-dire
+            la difference entre les tailles des couvertures minimales du
+            graphe d'origine et du graphe reduit.
+        faisable : False si la regle de Buss a montre qu'il n'existe pas de
+            couverture de taille au plus k.
+    """
+
+    def __init__(self):
+        self.operations = []
+        self.decalage = 0
+        self.faisable = True
+
+    def relever(self, couverture):
+        """
+        Retourne une couverture du graphe d'origine a partir d'une couverture
+        du graphe reduit.
+        Args :
+            couverture : ensemble de sommets (noms) du graphe reduit.
+        Returns :
+            un ensemble de sommets du graphe d'origine.
+        """
+        couverture = set(couverture)
+        #les operations sont defaites de la plus recente a la plus ancienne
+        for operation in reversed(self.operations):
+            if operation[0] == "force":
+                couverture.add(operation[1])
+            else:
+                _, x, v, u, w = operation
+                if x in couverture:
+                    couverture.discard(x)
+                    couverture.add(u)
+                    couverture.add(w)
+                else:
+                    couverture.add(v)
+        return couverture
+
+def reduire(graphe, k = None, plier = True):
+    """
+    Applique les regles de reduction jusqu'a ce qu'aucune ne s'applique.
+    Args :
+        graphe : objet du type Graphe.
+        k (facultatif) : taille de couverture recherchee, pour la regle de
+            Buss. Si None, la regle n'est pas appliquee.
+        plier (facultatif) : si False, la regle de degre 2 n'est appliquee
+            que dans le cas du triangle et le graphe reduit est un sous-graphe
+            induit du graphe d'origine.
+    Returns :
+        un tuple (grapheReduit, relevement) forme par le graphe reduit (objet
+        du type Graphe) et un objet Relevement.
+    """
+    from projet import Graphe
+
+    etiquettes = graphe.sommets()
+    nouveau = max(etiquettes, default = -1) + 1
+    adj = {s: set() for s in etiquettes}
+    for u, v in graphe.listeAretes():
+        adj[u].add(v)
+        adj[v].add(u)
+    relevement = Relevement()
+
+    def retirer(s):
+        for t in adj.pop(s):
+            adj[t].discard(s)
+            aTraiter.append(t)
+
+    def forcer(s):
+        relevement.operations.append(("force", s))
+        relevement.decalage += 1
+        retirer(s)
+
+    aTraiter = deque(etiquettes)
+    while aTraiter:
+        while aTraiter:
+            v = aTraiter.popleft()
+            if v not in adj:
+                continue
+            degre = len(adj[v])
+            if degre == 0:
+                del adj[v]
+            elif degre == 1:
+                forcer(next(iter(adj[v])))
+            elif degre == 2:
+                u, w = sorted(adj[v])
+                if w in adj[u]:
+                    forcer(u)
+                    forcer(w)
+                elif plier:
+                    #pliage de v, u et w en un nouveau sommet x
+                    x = nouveau
+                    nouveau += 1
+                    voisins = (adj[u] | adj[w]) - {v}
+                    for s in (v, u, w):
+                        retirer(s)
+                    adj[x] = voisins
+                    for t in voisins:
+                        adj[t].add(x)
+                    aTraiter.append(x)
+                    relevement.operations.append(("pli", x, v, u, w))
+                    relevement.decalage += 1
+        #regle de Buss, le seuil diminue a chaque sommet mis dans la couverture
+        if k is not None:
+            for v in list(adj):
+                if v in adj and len(adj[v]) > k - relevement.decalage:
+                    forcer(v)
+    if k is not None:
+        kRestant = k - relevement.decalage
+        nbAretes = sum(len(voisins) for voisins in adj.values()) // 2
+        relevement.faisable = kRestant >= 0 and nbAretes <= kRestant**2
+
+    sommets = list(adj)
+    aretes = [(u, v) for u in sommets for v in sorted(adj[u]) if u < v]
+    grapheReduit = Graphe()
+    grapheReduit._depuisNoms(sommets, aretes)
+    return grapheReduit, relevement
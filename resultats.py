@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Ariana CARNIELLI
+Base de resultats des tests pour le projet de COMPLEX 2019-2020.
+
+Les mesures des fonctions de fonctionsTests sont ajoutees a une base SQLite
+locale, en ajout seul (les lignes ne peuvent etre ni modifiees ni
+supprimees). Chaque ligne contient une valeur mesuree (temps processeur,
+temps reel, nombre de noeuds ou ecart) avec la methode et ses arguments, les
+parametres du graphe, la graine, la revision git et la machine.
+
+Utilisation en ligne de commande :
+    python resultats.py importer base.sqlite fichier.npz [fichier.npz ...]
+    python resultats.py comparer base.sqlite revisionA revisionB
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mesures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    revision TEXT,
+    date TEXT,
+    machine TEXT,
+    source TEXT,
+    methode TEXT NOT NULL,
+    parametres TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    p REAL,
+    loiP TEXT,
+    graine INTEGER,
+    repetition INTEGER,
+    fois INTEGER NOT NULL DEFAULT 1,
+    mesure TEXT NOT NULL,
+    valeur REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mesuresRevision ON mesures (revision, mesure);
+CREATE TRIGGER IF NOT EXISTS mesuresSansModification BEFORE UPDATE ON mesures
+BEGIN SELECT RAISE(ABORT, 'base de resultats en ajout seul'); END;
+CREATE TRIGGER IF NOT EXISTS mesuresSansSuppression BEFORE DELETE ON mesures
+BEGIN SELECT RAISE(ABORT, 'base de resultats en ajout seul'); END;
+"""
+
+_COLONNES = ("revision", "date", "machine", "source", "methode", "parametres", "n", "p",
+             "loiP", "graine", "repetition", "fois", "mesure", "valeur")
+
+#lois de p des fichiers .npz, d'apres le suffixe du nom du tableau
+_LOIS_NPZ = {"Quart1": ("0.25", lambda n: 0.25), "Quart2": ("0.5", lambda n: 0.5),
+             "Quart3": ("0.75", lambda n: 0.75), "Sqrt": ("1/sqrt(n)", lambda n: 1 / np.sqrt(n)),
+             "1surN": ("1/n", lambda n: 1 / n)}
+
+#methodes et arguments des tableaux de resNoeuds.npz, dans l'ordre des lignes
+_ALGOS_NOEUDS = ([("algoBranchement", {})] +
+                 [("algoBranchementBorne", {"methodeMax": i, "methodeMin": j})
+                  for i in range(3) for j in range(3)] +
+                 [("algoBranchementAmeliore", {"sommetMax": s, "elimDegre1": e})
+                  for s, e in ((False, False), (True, False), (True, True))])
+
+def revisionGit(dossier = None):
+    """
+    Retourne la revision git courante (avec le suffixe -dirty s'il y a des
+    modifications non enregistrees), ou None si elle n'est pas disponible.
+    Args :
+        dossier (facultatif) : dossier du depot, par defaut celui du module.
+    """
+    dossier = dossier or os.path.dirname(os.path.abspath(__file__))
+    try:
+        sortie = subprocess.run(["git", "describe", "--always", "--dirty"], cwd = dossier,
+                                capture_output = True, text = True, check = True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return sortie.stdout.strip() or None
+
+class BaseResultats:
+    """
+    Classe pour representer une base de resultats SQLite. Peut etre utilisee
+    avec with pour fermer la connexion.
+
+    Attributs :
+        connexion : objet sqlite3.Connection.
+        revision : revision enregistree par defaut avec les mesures.
+        machine : nom de la machine enregistre avec les mesures.
+    """
+
+    def __init__(self, nomFichier, revision = None):
+        """
+        Ouvre (et cree si besoin) la base.
+        Args :
+            nomFichier : nom du fichier SQLite.
+            revision (facultatif) : revision enregistree par defaut, par
+                defaut la revision git courante.
+        """
+        self.connexion = sqlite3.connect(nomFichier)
+        self.connexion.executescript(_SCHEMA)
+        self.revision = revision or revisionGit()
+        self.machine = "{} ({})".format(platform.node(), platform.machine())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fermer()
+
+    def fermer(self):
+        """
+        Ferme la connexion a la base.
+        """
+        self.connexion.close()
+
+    def ajouter(self, lignes):
+        """
+        Ajoute des mesures a la base.
+        Args :
+            lignes : iterable de dictionnaires avec au moins les cles methode,
+                n, mesure et valeur, et eventuellement les autres colonnes
+                (parametres peut etre un dictionnaire).
+        Returns :
+            le nombre de lignes ajoutees.
+        """
+        date = datetime.datetime.now().isoformat(timespec = "seconds")
+        valeurs = []
+        for ligne in lignes:
+            ligne = dict(ligne)
+            ligne.setdefault("revision", self.revision)
+            ligne.setdefault("machine", self.machine)
+            ligne.setdefault("date", date)
+            ligne.setdefault("fois", 1)
+            parametres = ligne.get("parametres", {})
+            if not isinstance(parametres, str):
+                parametres = json.dumps(parametres, sort_keys = True)
+            ligne["parametres"] = parametres
+            valeurs.append(tuple(_enPython(ligne.get(c)) for c in _COLONNES))
+        with self.connexion:
+            self.connexion.executemany(
+                "INSERT INTO mesures ({}) VALUES ({})".format(
+                    ", ".join(_COLONNES), ", ".join("?" * len(_COLONNES))), valeurs)
+        return len(valeurs)
+
+    def ajouterBenchmark(self, taches, valeurs, tempsProcessus, tempsReel, source = None):
+        """
+        Ajoute les resultats de fonctionsTests.executerBenchmark : les temps
+        de chaque tache et, pour les mesures "noeuds" et "ecart", la valeur
+        mesuree.
+        Args :
+            taches, valeurs, tempsProcessus, tempsReel : arguments et
+                resultats de executerBenchmark.
+            source (facultatif) : description de l'origine des mesures.
+        Returns :
+            le nombre de lignes ajoutees.
+        """
+        lignes = []
+        for i, (n, p, graine, nomMethode, kwargs, mesure) in enumerate(taches):
+            commun = dict(methode = nomMethode, parametres = kwargs, n = n, p = p,
+                          graine = graine, source = source)
+            lignes.append(dict(commun, mesure = "tempsProcessus", valeur = tempsProcessus[i]))
+            lignes.append(dict(commun, mesure = "tempsReel", valeur = tempsReel[i]))
+            if mesure != "temps":
+                lignes.append(dict(commun, mesure = mesure, valeur = valeurs[i]))
+        return self.ajouter(lignes)
+
+    def importerNpz(self, nomFichier, revision = "npz", fois = 100):
+        """
+        Importe un fichier .npz des tests du rapport (Tests.ipynb). La methode,
+        ses arguments et la loi de p sont deduits des noms des tableaux. Les
+        tableaux de temps sont des moyennes sur fois graphes ; les tableaux
+        d'ecart ont une colonne par repetition.
+        Args :
+            nomFichier : nom du fichier .npz.
+            revision (facultatif) : revision enregistree avec les mesures,
+                le code qui les a produites n'etant pas connu.
+            fois (facultatif) : nombre de repetitions des moyennes de temps.
+        Returns :
+            le nombre de lignes ajoutees.
+        """
+        donnees = np.load(nomFichier)
+        source = os.path.basename(nomFichier)
+        commun = dict(revision = revision, machine = None, source = source)
+        lignes = []
+        if "resNoeuds" in donnees.files:
+            res = donnees["resNoeuds"]
+            for i, (methode, parametres) in enumerate(_ALGOS_NOEUDS[:res.shape[0]]):
+                for j in range(res.shape[1]):
+                    p = donnees["p"][j]
+                    lignes.append(dict(commun, methode = methode, parametres = parametres,
+                                       n = donnees["n"][j], p = p, loiP = str(p),
+                                       mesure = "noeuds", valeur = res[i, j]))
+            return self.ajouter(lignes)
+        n = donnees["n"]
+        for nom in donnees.files:
+            if nom == "n":
+                continue
+            methode, parametres, loi = _decoderNomNpz(nom)
+            res = donnees[nom]
+            for ni in range(n.size):
+                ligne = dict(commun, methode = methode, parametres = parametres, n = n[ni],
+                             p = loi[1](n[ni]), loiP = loi[0])
+                if res.ndim == 2:
+                    lignes.extend(dict(ligne, repetition = f, mesure = "ecart", valeur = res[ni, f])
+                                  for f in range(res.shape[1]))
+                else:
+                    lignes.append(dict(ligne, fois = fois, mesure = "tempsProcessus",
+                                       valeur = res[ni]))
+        return self.ajouter(lignes)
+
+    def valeurs(self, revision, mesure):
+        """
+        Retourne les valeurs d'une mesure pour une revision, groupees par
+        experience. Les experiences sont identifiees par la valeur de p (a 12
+        chiffres significatifs) et non par la loi : les lignes de importerNpz
+        (loiP "1/sqrt(n)", ...) et celles de ajouterBenchmark (p seul) d'une 
+        meme experience sont ainsi dans le meme groupe.
+        Returns :
+            un dictionnaire (methode, parametres, n, p) -> liste de valeurs,
+            avec p une chaine (loiP si p est inconnu).
+        """
+        return self._groupes(revision, mesure)[0]
+
+    def _groupes(self, revision, mesure):
+        """
+        Retourne le dictionnaire de valeurs et un dictionnaire des cles de 
+        valeurs vers le nom de la loi de p (loiP, ou p si aucune ligne du 
+        groupe n'a de loi).
+        """
+        groupes = {}
+        lois = {}
+        requete = self.connexion.execute(
+            "SELECT methode, parametres, n, p, loiP, valeur FROM mesures "
+            "WHERE revision = ? AND mesure = ? ORDER BY id", (revision, mesure))
+        for methode, parametres, n, p, loiP, valeur in requete:
+            cle = (methode, parametres, n, str(loiP) if p is None else "{:.12g}".format(p))
+            groupes.setdefault(cle, []).append(valeur)
+            if loiP is not None or cle not in lois:
+                lois[cle] = cle[3] if loiP is None else str(loiP)
+        return groupes, lois
+
+    def comparer(self, revisionA, revisionB, mesures = ("tempsProcessus", "noeuds"),
+                 seuil = 0.05, tolerance = 0.05):
+        """
+        Compare deux revisions et signale les regressions de revisionB : pour
+        chaque experience (methode, parametres, n, p) presente dans les deux,
+        la moyenne de revisionB depasse celle de revisionA de plus de
+        tolerance (en relatif) et, s'il y a au moins deux valeurs de chaque
+        cote, un test de Welch unilateral rejette l'egalite au niveau seuil.
+        Args :
+            revisionA, revisionB : revisions de reference et a tester.
+            mesures (facultatif) : mesures a comparer.
+            seuil (facultatif) : niveau du test.
+            tolerance (facultatif) : augmentation relative minimale signalee.
+        Returns :
+            la liste des regressions, chacune un dictionnaire avec les cles
+            mesure, methode, parametres, n, p, loiP (nom de la loi si une des 
+            revisions l'a enregistree), moyenneA, moyenneB, rapport et pValeur
+            (None sans test).
+        """
+        regressions = []
+        for mesure in mesures:
+            groupesA, loisA = self._groupes(revisionA, mesure)
+            groupesB, loisB = self._groupes(revisionB, mesure)
+            for cle in sorted(groupesA.keys() & groupesB.keys()):
+                a = np.array(groupesA[cle], dtype = float)
+                b = np.array(groupesB[cle], dtype = float)
+                moyenneA, moyenneB = a.mean(), b.mean()
+                rapport = moyenneB / moyenneA if moyenneA > 0 else (np.inf if moyenneB > 0 else 1.0)
+                if not rapport > 1 + tolerance:
+                    continue
+                pValeur = _testWelch(a, b)
+                if pValeur is not None and pValeur >= seuil:
+                    continue
+                methode, parametres, n, p = cle
+                loiP = loisA[cle] if loisA[cle] != p else loisB[cle]
+                regressions.append(dict(mesure = mesure, methode = methode,
+                                        parametres = parametres, n = n, p = p, loiP = loiP,
+                                        moyenneA = moyenneA, moyenneB = moyenneB,
+                                        rapport = rapport, pValeur = pValeur))
+        return regressions
+
+def _enPython(valeur):
+    """
+    Convertit les scalaires numpy en types Python pour sqlite3.
+    """
+    return valeur.item() if isinstance(valeur, np.generic) else valeur
+
+def _decoderNomNpz(nom):
+    """
+    Retourne la methode, ses arguments et la loi de p (nom, fonction de n)
+    d'un tableau des fichiers .npz, par exemple resBranchementAmeliore
+    VFSqrt ou resBranchementBorne01.
+    """
+    loi = _LOIS_NPZ["Quart1"]
+    for suffixe, loiSuffixe in _LOIS_NPZ.items():
+        if nom.endswith(suffixe):
+            nom = nom[:-len(suffixe)]
+            loi = loiSuffixe
+            break
+    for prefixe, methode in (("resCouplage", "algoCouplage"),
+                             ("resGlouton", "algoGloutonSansCopies")):
+        if nom == prefixe:
+            return methode, {}, loi
+    if nom.startswith("resBranchementBorne"):
+        codes = nom[len("resBranchementBorne"):]
+        return "algoBranchementBorne", {"methodeMax": int(codes[0]),
+                                        "methodeMin": int(codes[1])}, loi
+    if nom.startswith("resBranchementAmeliore"):
+        codes = nom[len("resBranchementAmeliore"):]
+        return "algoBranchementAmeliore", {"sommetMax": codes[0] == "V",
+                                           "elimDegre1": codes[1] == "V"}, loi
+    if nom == "resBranchement":
+        return "algoBranchement", {}, loi
+    raise ValueError("tableau {} : methode inconnue".format(nom))
+
+def _testWelch(a, b):
+    """
+    Retourne la p-valeur du test de Welch unilateral (moyenne de b plus
+    grande que celle de a), ou None s'il n'y a pas deux valeurs de chaque
+    cote. Si les deux echantillons sont constants, la p-valeur est 0.
+    """
+    if a.size < 2 or b.size < 2:
+        return None
+    va, vb = a.var(ddof = 1) / a.size, b.var(ddof = 1) / b.size
+    if va + vb == 0:
+        return 0.0
+    t = (b.mean() - a.mean()) / np.sqrt(va + vb)
+    libertes = (va + vb)**2 / (va**2 / (a.size - 1) + vb**2 / (b.size - 1))
+    from scipy import stats
+    return float(stats.t.sf(t, libertes))
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "Base de resultats des tests.")
+    commandes = parser.add_subparsers(dest = "commande", required = True)
+    importer = commandes.add_parser("importer", help = "importe des fichiers .npz")
+    importer.add_argument("base")
+    importer.add_argument("fichiers", nargs = "+")
+    importer.add_argument("--revision", default = "npz")
+    comparer = commandes.add_parser("comparer", help = "compare deux revisions")
+    comparer.add_argument("base")
+    comparer.add_argument("revisionA")
+    comparer.add_argument("revisionB")
+    comparer.add_argument("--seuil", type = float, default = 0.05)
+    comparer.add_argument("--tolerance", type = float, default = 0.05)
+    args = parser.parse_args()
+
+    with BaseResultats(args.base) as base:
+        if args.commande == "importer":
+            for nomFichier in args.fichiers:
+                print(nomFichier, ":", base.importerNpz(nomFichier, args.revision), "mesures")
+        else:
+            regressions = base.comparer(args.revisionA, args.revisionB,
+                                        seuil = args.seuil, tolerance = args.tolerance)
+            for r in regressions:
+                pValeur = "-" if r["pValeur"] is None else "{:.3g}".format(r["pValeur"])
+                print("{mesure} {methode} {parametres} n = {n} p = {loiP} : {moyenneA:.4g} -> "
+                      "{moyenneB:.4g} (x{rapport:.2f}, p = {0})".format(pValeur, **r))
+            print(len(regressions), "regression(s)")
+            raise SystemExit(1 if regressions else 0)